@@ -0,0 +1,98 @@
+"""Interactive CLI demo against a running src.app server."""
+
+import asyncio
+
+from src.common.config import config
+from src.common.utils import format_json, setup_logger
+
+logger = setup_logger(__name__)
+
+SYSTEM_PROMPT = """You are a helpful assistant with access to tools for \
+document retrieval (RAG), file access, web search and maps. Use tools when \
+they help answer the user's question."""
+
+
+async def run_demo() -> None:
+    """Connect to the MCP servers and chat on stdin/stdout."""
+    # Deferred so `python demo.py --help`-style invocations and import
+    # don't pay the langgraph/openai cold-start cost.
+    from src.graph.agent_graph import create_agent_graph
+    from src.llm.interface import LLMInterface
+    from src.mcp.client.manager import MCPClientManager
+
+    mcp_manager = MCPClientManager()
+    if config.server.mcp_inproc:
+        # Host the MCP servers inside the demo process: tool calls become
+        # plain coroutine calls with no loopback HTTP in between.
+        from src.mcp.server.brave_search import brave_search_mcp
+        from src.mcp.server.file_mcp import file_mcp
+        from src.mcp.server.google_maps import google_maps_mcp
+        from src.mcp.server.rag import rag_mcp
+
+        rag_client, file_client, brave_search_client, google_maps_client = await asyncio.gather(
+            mcp_manager.create_client_inproc("rag", rag_mcp),
+            mcp_manager.create_client_inproc("file", file_mcp),
+            mcp_manager.create_client_inproc("brave-search", brave_search_mcp),
+            mcp_manager.create_client_inproc("google-maps", google_maps_mcp),
+        )
+    else:
+        base_url = f"http://{config.server.host}:{config.server.port}"
+        gather_timeout = config.server.mcp_per_call_timeout + config.server.mcp_gather_buffer
+        try:
+            rag_client, file_client, brave_search_client, google_maps_client = await asyncio.wait_for(
+                asyncio.gather(
+                    mcp_manager.create_client_http("rag", f"{base_url}/rag"),
+                    mcp_manager.create_client_http("file", f"{base_url}/file"),
+                    mcp_manager.create_client_http("brave-search", f"{base_url}/brave-search"),
+                    mcp_manager.create_client_http("google-maps", f"{base_url}/google-maps"),
+                ),
+                timeout=gather_timeout,
+            )
+        except asyncio.TimeoutError:
+            logger.error(f"MCP client creation exceeded {gather_timeout:.0f}s; is src.app running?")
+            await mcp_manager.close_all()
+            return
+    if not all([rag_client, file_client, brave_search_client, google_maps_client]):
+        logger.error("Failed to connect to one or more MCP servers; is src.app running?")
+        await mcp_manager.close_all()
+        return
+
+    tools = mcp_manager.get_all_tools()
+    print(f"Connected. {len(tools)} tools available.\n")
+
+    llm = LLMInterface(
+        provider=config.llm.provider,
+        model=config.llm.model,
+        system_prompt=SYSTEM_PROMPT,
+        tools=tools,
+        openai_tools=mcp_manager.get_openai_tools(),
+    )
+    agent_graph = create_agent_graph(llm, mcp_manager)
+
+    try:
+        while True:
+            try:
+                user_input = input("you> ").strip()
+            except (EOFError, KeyboardInterrupt):
+                break
+            if not user_input or user_input.lower() in {"exit", "quit"}:
+                break
+            async for state in agent_graph.run_stream(user_input):
+                if state.get("tool_results"):
+                    for tool_result in state["tool_results"]:
+                        print(f"[tool {tool_result['tool']}]")
+                        print(format_json(tool_result["result"]))
+                if state.get("done") and state.get("content"):
+                    print(f"agent> {state['content']}\n")
+    finally:
+        await mcp_manager.close_all()
+
+
+if __name__ == "__main__":
+    try:
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass
+    asyncio.run(run_demo())
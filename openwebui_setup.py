@@ -0,0 +1,41 @@
+"""Fetch and build the Open WebUI frontend into ./webui."""
+
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_URL = "https://github.com/open-webui/open-webui.git"
+TEMP_DIR = "temp_webui"
+TARGET_DIR = "webui"
+
+
+def main() -> None:
+    if Path(TARGET_DIR).exists():
+        print(f"{TARGET_DIR}/ already exists; remove it to rebuild.")
+        return
+
+    print("Cloning Open WebUI ...")
+    subprocess.run(["git", "clone", "--depth", "1", REPO_URL, TEMP_DIR], check=True)
+
+    print("Building frontend ...")
+    subprocess.run(["npm", "install"], cwd=TEMP_DIR, check=True)
+    subprocess.run(["npm", "run", "build"], cwd=TEMP_DIR, check=True)
+
+    dist = Path(TEMP_DIR) / "build"
+    if not dist.exists():
+        dist = Path(TEMP_DIR) / "frontend" / "dist"
+    if not dist.exists():
+        print("Build output not found", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"Installing into {TARGET_DIR}/ ...")
+    # A move is a rename on the same filesystem: no byte copies of the
+    # built frontend, unlike copytree.
+    shutil.move(str(dist), TARGET_DIR)
+    shutil.rmtree(TEMP_DIR)
+    print("Done.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,331 @@
+"""Agent HTTP API: session management and streaming chat."""
+
+import asyncio
+import time
+from typing import Any, Dict
+
+from fastapi import BackgroundTasks, FastAPI, HTTPException
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+from src.common.config import config
+from src.common.session_store import create_session_store
+from src.common.utils import json_dumps, setup_logger
+
+logger = setup_logger(__name__)
+
+api = FastAPI(title="MCP RAG Agent API")
+
+# Bound once so session init does a single global load instead of two
+# pydantic attribute lookups per field.
+_BASE_URL = f"http://{config.server.host}:{config.server.port}"
+
+agent_graphs: Dict[str, Any] = {}
+
+# One MCPClientManager serves every session: the MCP servers are global
+# singletons and their tools are stateless, so per-session managers only
+# multiplied HTTP pools and handshakes by the session count.
+SHARED_MCP_MANAGER: Any = None
+_manager_lock = asyncio.Lock()
+
+# Bound concurrently streaming sessions so burst load degrades into
+# queueing instead of tail-latency collapse.
+SESSION_SEM = asyncio.Semaphore(config.server.max_sessions)
+
+# Conversation history and session ownership live here; with REDIS_URL
+# set, multiple uvicorn workers share them and restarts keep chats.
+session_store = create_session_store()
+
+# One semantic cache shared by every session: identical-meaning prompts
+# across users short-circuit the LLM call entirely. Built lazily so the
+# rag/numpy import graph is only paid when the cache is enabled and the
+# first agent session actually starts.
+_semantic_cache: Any = None
+
+
+def _get_semantic_cache():
+    global _semantic_cache
+    if _semantic_cache is None and config.llm.semantic_cache:
+        from src.llm.semantic_cache import SemanticCache
+
+        _semantic_cache = SemanticCache(
+            max_distance=config.llm.semantic_cache_distance,
+            ttl=config.llm.semantic_cache_ttl,
+        )
+    return _semantic_cache
+
+SYSTEM_PROMPT = """You are a helpful assistant with access to tools for \
+document retrieval (RAG), file access, web search and maps. Use tools when \
+they help answer the user's question, and cite retrieved documents when you \
+rely on them."""
+
+
+class ChatRequest(BaseModel):
+    session_id: str
+    message: str
+
+
+# The four MCP servers are process-wide singletons, so the tool schema
+# blob is identical for every session; build it once and hand the same
+# list object to each LLMInterface instead of re-walking the registry.
+_TOOLS_BLOB: Any = None
+
+# Exact-match LLM completion cache, shared across sessions.
+_LLM_CACHE: Any = None
+
+
+def _get_llm_cache():
+    global _LLM_CACHE
+    if _LLM_CACHE is None and config.llm.response_cache:
+        from src.llm.cache import LLMCache
+
+        _LLM_CACHE = LLMCache()
+    return _LLM_CACHE
+
+
+async def get_shared_manager():
+    """Initialize (once) and return the process-wide MCPClientManager."""
+    global SHARED_MCP_MANAGER
+    if SHARED_MCP_MANAGER is not None:
+        return SHARED_MCP_MANAGER
+    async with _manager_lock:
+        if SHARED_MCP_MANAGER is not None:
+            return SHARED_MCP_MANAGER
+
+        from src.mcp.client.manager import MCPClientManager
+
+        mcp_manager = MCPClientManager()
+        await _connect_clients(mcp_manager)
+        SHARED_MCP_MANAGER = mcp_manager
+        return mcp_manager
+
+
+async def _connect_clients(mcp_manager) -> None:
+    if config.server.mcp_inproc:
+        # The MCP servers live on this very app, so skip the HTTP loopback
+        # and dispatch tool calls in-process.
+        from src.mcp.server.brave_search import brave_search_mcp
+        from src.mcp.server.file_mcp import file_mcp
+        from src.mcp.server.google_maps import google_maps_mcp
+        from src.mcp.server.rag import rag_mcp
+
+        rag_client, file_client, brave_search_client, google_maps_client = await asyncio.gather(
+            mcp_manager.create_client_inproc("rag", rag_mcp),
+            mcp_manager.create_client_inproc("file", file_mcp),
+            mcp_manager.create_client_inproc("brave-search", brave_search_mcp),
+            mcp_manager.create_client_inproc("google-maps", google_maps_mcp),
+        )
+    else:
+        base_url = _BASE_URL
+        gather_timeout = config.server.mcp_per_call_timeout + config.server.mcp_gather_buffer
+        try:
+            rag_client, file_client, brave_search_client, google_maps_client = await asyncio.wait_for(
+                asyncio.gather(
+                    mcp_manager.create_client_http("rag", f"{base_url}/rag"),
+                    mcp_manager.create_client_http("file", f"{base_url}/file"),
+                    mcp_manager.create_client_http("brave-search", f"{base_url}/brave-search"),
+                    mcp_manager.create_client_http("google-maps", f"{base_url}/google-maps"),
+                ),
+                timeout=gather_timeout,
+            )
+        except asyncio.TimeoutError:
+            await mcp_manager.close_all()
+            raise RuntimeError(
+                f"MCP client creation exceeded {gather_timeout:.0f}s; a server is not responding"
+            )
+    if not all([rag_client, file_client, brave_search_client, google_maps_client]):
+        await mcp_manager.close_all()
+        raise RuntimeError("Failed to connect to one or more MCP servers")
+
+
+async def initialize_agent(session_id: str):
+    """Create (or reuse) the agent graph for a session."""
+    if session_id in agent_graphs:
+        return agent_graphs[session_id]
+
+    # Imported here so /health and session teardown never pay for the
+    # langgraph/openai import graph.
+    from src.graph.agent_graph import create_agent_graph
+    from src.llm.interface import LLMInterface
+
+    mcp_manager = await get_shared_manager()
+
+    global _TOOLS_BLOB
+    if _TOOLS_BLOB is None:
+        _TOOLS_BLOB = mcp_manager.get_all_tools()
+    tools = _TOOLS_BLOB
+    llm = LLMInterface(
+        provider=config.llm.provider,
+        model=config.llm.model,
+        system_prompt=SYSTEM_PROMPT,
+        tools=tools,
+        cache=_get_llm_cache(),
+        openai_tools=mcp_manager.get_openai_tools(),
+    )
+    history = await session_store.load_history(session_id)
+    if history:
+        # Another worker (or a previous process) already served this
+        # session; resume its conversation instead of starting fresh.
+        llm.messages = history
+    await session_store.claim_owner(session_id)
+
+    agent_graph = create_agent_graph(llm, mcp_manager, semantic_cache=_get_semantic_cache())
+    agent_graphs[session_id] = agent_graph
+    logger.info(f"Initialized agent for session {session_id}")
+    return agent_graph
+
+
+async def process_message_stream(session_id: str, message: str):
+    """Run the agent and stream state updates to the client."""
+    async with SESSION_SEM:
+        async for frame in _stream_session(session_id, message):
+            yield frame
+
+
+# Content deltas arriving within this window are coalesced into one SSE
+# frame, amortizing json encoding and write syscalls at generation speed.
+CONTENT_FLUSH_INTERVAL = 0.01
+
+
+def _state_events(state: Dict[str, Any]):
+    """Build the SSE events for a snapshot's tool activity.
+
+    One event per call/result so parallel tool calls all reach the
+    client; snapshot-level dedup is handled upstream (execute_tools
+    clears dispatched calls, generate_response resets results).
+    """
+    events = []
+    for tool_call in state.get("tool_calls") or ():
+        events.append(
+            json_dumps({"type": "tool_call", "tool": tool_call.function.get("name", "")})
+        )
+    for tool_result in state.get("tool_results") or ():
+        # The result object is embedded as-is: encoding it to a string
+        # first would double both the encode work and the wire bytes.
+        events.append(
+            json_dumps({"type": "tool_result", "result": tool_result.get("result", {})})
+        )
+    return events
+
+
+async def _stream_session(session_id: str, message: str):
+    agent_graph = await initialize_agent(session_id)
+    state_iter = agent_graph.run_stream(message).__aiter__()
+    pending = None
+    pending_content = []
+    last_flush = time.monotonic()
+
+    def flush_content():
+        nonlocal last_flush
+        if not pending_content:
+            return None
+        frame = (
+            b"data: "
+            + json_dumps({"type": "content", "content": "".join(pending_content)})
+            + b"\n\n"
+        )
+        pending_content.clear()
+        last_flush = time.monotonic()
+        return frame
+
+    try:
+        while True:
+            if pending is None:
+                pending = asyncio.ensure_future(state_iter.__anext__())
+            done, _ = await asyncio.wait({pending}, timeout=15)
+            if not done:
+                # SSE comment frame keeps proxies and EventSource
+                # connections alive during long tool calls.
+                yield b": ping\n\n"
+                continue
+            try:
+                state = pending.result()
+            except StopAsyncIteration:
+                pending = None
+                break
+            except Exception as e:
+                logger.error(f"Agent run failed for session {session_id}: {e}")
+                pending = None
+                yield b"data: " + json_dumps({"type": "error", "error": str(e)}) + b"\n\n"
+                break
+            pending = None
+            # Content arrives exclusively as deltas pushed while the
+            # provider streams; snapshot "content" is the assembled turn
+            # and re-emitting it would duplicate every delta.
+            if "content_delta" in state:
+                pending_content.append(state["content_delta"])
+                if time.monotonic() - last_flush > CONTENT_FLUSH_INTERVAL:
+                    frame = flush_content()
+                    if frame is not None:
+                        yield frame
+                continue
+            events = _state_events(state)
+            if events:
+                # Ordering: buffered content always precedes tool events.
+                frame = flush_content()
+                if frame is not None:
+                    yield frame
+                for event in events:
+                    await session_store.append_event(session_id, {"event": event.decode()})
+                    yield b"data: " + event + b"\n\n"
+        frame = flush_content()
+        if frame is not None:
+            yield frame
+        await session_store.save_history(session_id, agent_graph.llm.messages)
+        yield b'data: {"done": true}\n\n'
+    except asyncio.CancelledError:
+        # Client disconnected: propagate cancellation into the agent run
+        # instead of leaving an orphaned task behind.
+        if pending is not None:
+            pending.cancel()
+        await state_iter.aclose()
+        raise
+
+
+@api.post("/chat")
+async def chat(request: ChatRequest):
+    """Stream the agent's response for one user message."""
+    return StreamingResponse(
+        process_message_stream(request.session_id, request.message),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+            "Connection": "keep-alive",
+        },
+    )
+
+
+async def cleanup_agent(session_id: str) -> None:
+    """Tear down a session's agent graph and stored state.
+
+    The shared MCPClientManager stays up; it is only closed at process
+    shutdown via shutdown_shared_manager.
+    """
+    agent_graphs.pop(session_id, None)
+    await session_store.delete(session_id)
+    logger.info(f"Cleaned up session {session_id}")
+
+
+async def shutdown_shared_manager() -> None:
+    """Close the shared manager (process shutdown only)."""
+    global SHARED_MCP_MANAGER
+    if SHARED_MCP_MANAGER is not None:
+        await SHARED_MCP_MANAGER.close_all()
+        SHARED_MCP_MANAGER = None
+
+
+@api.delete("/chat/{session_id}")
+async def end_session(session_id: str, background_tasks: BackgroundTasks):
+    """End a session and release its resources."""
+    if session_id not in agent_graphs:
+        raise HTTPException(status_code=404, detail="Unknown session")
+    # FastAPI only runs BackgroundTasks it injected itself; a locally
+    # constructed instance is silently dropped and the cleanup never ran.
+    background_tasks.add_task(cleanup_agent, session_id)
+    return {"status": "session closed", "session_id": session_id}
+
+
+@api.get("/health")
+async def health():
+    return {"status": "ok", "sessions": len(agent_graphs)}
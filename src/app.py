@@ -0,0 +1,72 @@
+"""Combined server: four MCP servers plus the agent API on one app."""
+
+from contextlib import asynccontextmanager
+
+import uvicorn
+from fastapi import FastAPI
+
+from src.api import api, shutdown_shared_manager
+from src.common.config import config
+from src.common.utils import setup_logger
+from src.mcp.server.brave_search import brave_search_mcp
+from src.mcp.server.file_mcp import file_mcp
+from src.mcp.server.google_maps import google_maps_mcp
+from src.mcp.server.rag import close_retriever, rag_mcp
+
+logger = setup_logger(__name__)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run the four MCP session managers for the app's lifetime.
+
+    The context managers are held onto so shutdown exits the *same*
+    contexts that startup entered. Entry is serial and stays in this
+    task: the managers' anyio cancel scopes are task-bound, so an
+    __aenter__ run in a gather()-spawned task makes every __aexit__
+    from here raise at shutdown.
+    """
+    cms = [
+        rag_mcp.session_manager.run(),
+        file_mcp.session_manager.run(),
+        brave_search_mcp.session_manager.run(),
+        google_maps_mcp.session_manager.run(),
+    ]
+    for cm in cms:
+        await cm.__aenter__()
+    logger.info("MCP session managers started")
+    try:
+        yield
+    finally:
+        await shutdown_shared_manager()
+        await close_retriever()
+        for cm in reversed(cms):
+            await cm.__aexit__(None, None, None)
+        logger.info("MCP session managers stopped")
+
+
+app = FastAPI(title="MCP RAG Agent", lifespan=lifespan)
+
+app.mount("/rag", rag_mcp.streamable_http_app())
+app.mount("/file", file_mcp.streamable_http_app())
+app.mount("/brave-search", brave_search_mcp.streamable_http_app())
+app.mount("/google-maps", google_maps_mcp.streamable_http_app())
+app.mount("/agent", api)
+
+
+def main() -> None:
+    extra = {}
+    try:
+        import httptools  # noqa: F401
+        import uvloop  # noqa: F401
+
+        # libuv loop + C HTTP parser: significant throughput headroom for
+        # the many small JSON round-trips between the agent and the MCP
+        # mounts. Both ship with uvicorn[standard].
+        extra = {"loop": "uvloop", "http": "httptools"}
+    except ImportError:
+        pass
+    uvicorn.run("src.app:app", host=config.server.host, port=config.server.port, **extra)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Central configuration for the MCP RAG agent.
+
+All settings come from environment variables (optionally via a .env file)
+so the same code runs in the demo, the API server and the MCP servers.
+"""
+
+import os
+from functools import lru_cache
+
+from dotenv import load_dotenv
+from pydantic import BaseModel, ConfigDict
+
+load_dotenv()
+
+
+class ServerConfig(BaseModel):
+    """Host/port settings for the combined FastAPI + MCP server."""
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    host: str = os.getenv("SERVER_HOST", "0.0.0.0")
+    port: int = int(os.getenv("SERVER_PORT", "8000"))
+    mcp_per_call_timeout: float = float(os.getenv("MCP_PER_CALL_TIMEOUT", "30"))
+    mcp_gather_buffer: float = float(os.getenv("MCP_GATHER_BUFFER", "10"))
+    pool_size: int = int(os.getenv("MCP_POOL_SIZE", "100"))
+    mcp_inproc: bool = os.getenv("MCP_INPROC", "1") == "1"
+    mcp_concurrency: int = int(os.getenv("MCP_CONCURRENCY", "16"))
+    # Tool calls per minute; 0 disables rate limiting.
+    mcp_rpm: int = int(os.getenv("MCP_RPM", "0"))
+    max_sessions: int = int(os.getenv("MAX_SESSIONS", "64"))
+
+
+class LLMConfig(BaseModel):
+    """LLM provider selection and credentials."""
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    provider: str = os.getenv("LLM_PROVIDER", "openai")
+    model: str = os.getenv("LLM_MODEL", "gpt-4o-mini")
+    openai_api_key: str = os.getenv("OPENAI_API_KEY", "")
+    nvidia_api_key: str = os.getenv("NVIDIA_API_KEY", "")
+    temperature: float = float(os.getenv("LLM_TEMPERATURE", "0.7"))
+    response_cache: bool = os.getenv("LLM_RESPONSE_CACHE", "0") == "1"
+    semantic_cache: bool = os.getenv("SEMANTIC_CACHE", "0") == "1"
+    semantic_cache_distance: float = float(os.getenv("SEMANTIC_CACHE_DISTANCE", "0.1"))
+    semantic_cache_ttl: int = int(os.getenv("SEMANTIC_CACHE_TTL", "3600"))
+
+
+class RAGConfig(BaseModel):
+    """Embedding model and vector store settings."""
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    embedding_model: str = os.getenv("EMBEDDING_MODEL", "baai/bge-m3")
+    embedding_dim: int = int(os.getenv("EMBEDDING_DIM", "1024"))
+    index_path: str = os.getenv("RAG_INDEX_PATH", "data/rag_index")
+    top_k: int = int(os.getenv("RAG_TOP_K", "5"))
+
+
+class RedisConfig(BaseModel):
+    """Optional Redis backing for shared session state."""
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    url: str = os.getenv("REDIS_URL", "")
+    session_ttl: int = int(os.getenv("SESSION_TTL", "3600"))
+
+
+class Config(BaseModel):
+    """Aggregated application configuration."""
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    server: ServerConfig = ServerConfig()
+    llm: LLMConfig = LLMConfig()
+    rag: RAGConfig = RAGConfig()
+    redis: RedisConfig = RedisConfig()
+
+
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Build the (frozen) config exactly once per process."""
+    return Config()
+
+
+config = get_config()
@@ -0,0 +1,115 @@
+"""Session persistence for multi-worker deployments.
+
+Live objects (MCPClientManager, compiled agent graphs) stay local to the
+worker that built them; what goes to Redis is the conversation history,
+a TTL'd owner pointer used for sticky routing, and a capped per-session
+event stream. With no REDIS_URL configured (or redis not installed) an
+in-memory store keeps the single-process behavior unchanged.
+"""
+
+import json
+import os
+import socket
+from typing import Any, Dict, List, Optional
+
+from src.common.config import config
+from src.common.utils import json_dumps, setup_logger
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:  # pragma: no cover - optional dependency
+    aioredis = None
+
+logger = setup_logger(__name__)
+
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}"
+
+
+class RedisSessionStore:
+    """Shares session state across uvicorn workers via Redis."""
+
+    def __init__(self, url: str):
+        self._redis = aioredis.from_url(url)
+        self._ttl = config.redis.session_ttl
+
+    @staticmethod
+    def _state_key(session_id: str) -> str:
+        return f"agent:session:{session_id}:state"
+
+    @staticmethod
+    def _owner_key(session_id: str) -> str:
+        return f"agent:session:{session_id}:owner"
+
+    @staticmethod
+    def _events_key(session_id: str) -> str:
+        return f"agent:session:{session_id}:events"
+
+    async def load_history(self, session_id: str) -> Optional[List[Dict[str, Any]]]:
+        raw = await self._redis.get(self._state_key(session_id))
+        if raw is None:
+            return None
+        return json.loads(raw)
+
+    async def save_history(self, session_id: str, messages: List[Dict[str, Any]]) -> None:
+        await self._redis.set(
+            self._state_key(session_id), json_dumps(messages), ex=self._ttl
+        )
+
+    async def claim_owner(self, session_id: str) -> None:
+        """Point the session at this worker so requests can sticky-route."""
+        await self._redis.set(self._owner_key(session_id), WORKER_ID, ex=self._ttl)
+
+    async def append_event(self, session_id: str, event: Dict[str, Any]) -> None:
+        """Append to the session's time-ordered action log (capped)."""
+        await self._redis.xadd(
+            self._events_key(session_id),
+            {"data": json_dumps(event)},
+            maxlen=1000,
+            approximate=True,
+        )
+
+    async def delete(self, session_id: str) -> None:
+        await self._redis.delete(
+            self._state_key(session_id),
+            self._owner_key(session_id),
+            self._events_key(session_id),
+        )
+
+    async def aclose(self) -> None:
+        await self._redis.aclose()
+
+
+class InMemorySessionStore:
+    """Single-process fallback with the same interface."""
+
+    def __init__(self):
+        self._histories: Dict[str, List[Dict[str, Any]]] = {}
+
+    async def load_history(self, session_id: str) -> Optional[List[Dict[str, Any]]]:
+        return self._histories.get(session_id)
+
+    async def save_history(self, session_id: str, messages: List[Dict[str, Any]]) -> None:
+        self._histories[session_id] = list(messages)
+
+    async def claim_owner(self, session_id: str) -> None:
+        pass
+
+    async def append_event(self, session_id: str, event: Dict[str, Any]) -> None:
+        pass
+
+    async def delete(self, session_id: str) -> None:
+        self._histories.pop(session_id, None)
+
+    async def aclose(self) -> None:
+        pass
+
+
+def create_session_store():
+    """Pick Redis when configured and installed, else in-memory."""
+    if config.redis.url:
+        if aioredis is None:
+            logger.warning("REDIS_URL set but redis is not installed; using in-memory store")
+        else:
+            logger.info(f"Using Redis session store at {config.redis.url}")
+            return RedisSessionStore(config.redis.url)
+    return InMemorySessionStore()
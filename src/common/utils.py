@@ -0,0 +1,49 @@
+"""Shared helpers: logging setup and JSON formatting."""
+
+import json
+import logging
+import sys
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None
+
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+
+def json_dumps(data: Any) -> bytes:
+    """Serialize to compact JSON bytes, via orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, default=str)
+    return json.dumps(data, ensure_ascii=False, default=str).encode()
+
+
+def json_loads(data) -> Any:
+    """Parse JSON bytes/str, via orjson when available.
+
+    Number-heavy payloads (embedding responses in particular) parse
+    several times faster under orjson than stdlib json.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def setup_logger(name: str, level: int = logging.INFO) -> logging.Logger:
+    """Return a logger with a stream handler attached exactly once."""
+    logger = logging.getLogger(name)
+    if not logger.handlers:
+        handler = logging.StreamHandler(sys.stderr)
+        handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        logger.addHandler(handler)
+        logger.setLevel(level)
+    return logger
+
+
+def format_json(data: Any) -> str:
+    """Pretty-print arbitrary data as JSON for logs and demo output."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2, default=str).decode()
+    return json.dumps(data, indent=2, ensure_ascii=False, default=str)
@@ -0,0 +1,253 @@
+"""LangGraph agent: LLM turn -> tool execution loop -> final answer."""
+
+import asyncio
+from typing import Any, Dict, List, Optional, TypedDict
+
+from langgraph.graph import END, StateGraph
+
+from src.common.config import config
+from src.common.utils import setup_logger
+from src.llm.models import ToolCall
+
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None
+
+logger = setup_logger(__name__)
+
+MAX_TOOL_ROUNDS = 8
+
+
+def _parse_args(raw):
+    """Decode tool-call arguments if they arrived as a JSON string."""
+    if isinstance(raw, (str, bytes, bytearray)):
+        return orjson.loads(raw) if orjson is not None else json.loads(raw)
+    return raw
+
+
+def _serialize_result(result) -> str:
+    """Render a tool result as canonical JSON for the LLM.
+
+    str(dict) produces Python repr (single quotes) which the LLM has to
+    treat as prose; compact JSON costs fewer tokens and parses reliably.
+    """
+    if isinstance(result, str):
+        return result
+    try:
+        if orjson is not None:
+            return orjson.dumps(result, option=orjson.OPT_NON_STR_KEYS).decode()
+        return json.dumps(result, ensure_ascii=False, default=str)
+    except TypeError:
+        return repr(result)
+
+
+class AgentState(TypedDict, total=False):
+    """State threaded through the agent graph."""
+
+    input: str
+    processed_input: str
+    content: str
+    tool_calls: List[ToolCall]
+    tool_results: List[Dict[str, Any]]
+    tool_rounds: int
+    done: bool
+
+
+class AgentGraph:
+    """Compiled agent graph bound to one LLM conversation."""
+
+    def __init__(self, llm, mcp_manager, semantic_cache=None):
+        self.llm = llm
+        self.mcp_manager = mcp_manager
+        self.semantic_cache = semantic_cache
+        # Set for the duration of run_stream: generate_response pushes
+        # {"content_delta": text} items here as the provider streams, so
+        # consumers see tokens before the node (or the graph) finishes.
+        self._delta_queue: Optional[asyncio.Queue] = None
+        self._graph = self._build()
+
+    def _build(self):
+        llm = self.llm
+        mcp_manager = self.mcp_manager
+        semantic_cache = self.semantic_cache
+
+        async def process_input(state: AgentState) -> AgentState:
+            """Normalize the raw user input."""
+            state["processed_input"] = state["input"].strip()
+            state["tool_rounds"] = 0
+            return state
+
+        async def generate_response(state: AgentState) -> AgentState:
+            """Run one LLM turn; may produce content and/or tool calls."""
+            first_round = state["tool_rounds"] == 0
+            delta_queue = self._delta_queue
+            if first_round and semantic_cache is not None:
+                cached = await semantic_cache.get(state["processed_input"])
+                if cached is not None:
+                    # Keep the history coherent for follow-up turns even
+                    # though the provider was never called.
+                    llm.messages.append({"role": "user", "content": state["processed_input"]})
+                    llm.messages.append({"role": "assistant", "content": cached})
+                    if delta_queue is not None:
+                        delta_queue.put_nowait({"content_delta": cached})
+                    state["content"] = cached
+                    state["tool_calls"] = []
+                    state["tool_results"] = []
+                    return state
+            prompt = state["processed_input"] if first_round else None
+            if delta_queue is not None:
+                # Streaming turn: coalesced content deltas go out as the
+                # provider generates instead of after the full completion.
+                # (The exact-match completion cache only applies to the
+                # non-streaming chat() path below.)
+                content_parts: List[str] = []
+                tool_calls: List[Dict[str, Any]] = []
+                async for part in llm.chat_stream(prompt):
+                    if "content" in part:
+                        content_parts.append(part["content"])
+                        delta_queue.put_nowait({"content_delta": part["content"]})
+                    elif part.get("tool_calls"):
+                        tool_calls = part["tool_calls"]
+                state["content"] = "".join(content_parts)
+                state["tool_calls"] = [ToolCall(**tc) for tc in tool_calls]
+            else:
+                response = await llm.chat(prompt)
+                state["content"] = response.get("content", "")
+                state["tool_calls"] = [
+                    ToolCall(**tc) for tc in response.get("tool_calls", [])
+                ]
+            state["tool_results"] = []
+            if (
+                semantic_cache is not None
+                and first_round
+                and not state["tool_calls"]
+                and state["content"]
+            ):
+                # Tool-using turns depend on live data and are not cached.
+                await semantic_cache.set(state["processed_input"], state["content"])
+            return state
+
+        async def _run_one(tool_call: ToolCall) -> Dict[str, Any]:
+            """Execute one tool call and build its result record."""
+            tool_name = tool_call.function.get("name", "")
+            tool_args = tool_call.function.get("arguments", "{}")
+            tool_id = tool_call.id
+            try:
+                result = await mcp_manager.call_tool(tool_name, _parse_args(tool_args))
+                return {"id": tool_id, "tool": tool_name, "result": result, "success": True}
+            except Exception as e:
+                logger.error(f"Tool '{tool_name}' failed: {e}")
+                return {
+                    "id": tool_id,
+                    "tool": tool_name,
+                    "result": {"error": str(e)},
+                    "success": False,
+                }
+
+        async def execute_tools(state: AgentState) -> AgentState:
+            """Execute the LLM's tool calls concurrently.
+
+            Results are fed back to the LLM in the original call order so
+            the conversation history stays deterministic; history mutation
+            happens only after the gather, never inside _run_one.
+            """
+            gather_timeout = (
+                config.server.mcp_per_call_timeout + config.server.mcp_gather_buffer
+            )
+            tool_results = await asyncio.wait_for(
+                asyncio.gather(*[_run_one(tc) for tc in state["tool_calls"]]),
+                timeout=gather_timeout,
+            )
+            for tool_result in tool_results:
+                llm.handle_tool_response(
+                    tool_result["id"], _serialize_result(tool_result["result"])
+                )
+            state["tool_results"] = list(tool_results)
+            # Dispatched calls are cleared so the post-execute snapshot
+            # (stream_mode="values" re-emits the whole state) does not
+            # re-announce them to streaming consumers.
+            state["tool_calls"] = []
+            state["tool_rounds"] = state.get("tool_rounds", 0) + 1
+            return state
+
+        async def finalize(state: AgentState) -> AgentState:
+            """Mark the run as finished."""
+            state["done"] = True
+            return state
+
+        def should_continue(state: AgentState) -> str:
+            if state.get("tool_calls") and state.get("tool_rounds", 0) < MAX_TOOL_ROUNDS:
+                return "execute_tools"
+            return "finalize"
+
+        graph = StateGraph(AgentState)
+        graph.add_node("process_input", process_input)
+        graph.add_node("generate_response", generate_response)
+        graph.add_node("execute_tools", execute_tools)
+        graph.add_node("finalize", finalize)
+        graph.set_entry_point("process_input")
+        graph.add_edge("process_input", "generate_response")
+        graph.add_conditional_edges(
+            "generate_response",
+            should_continue,
+            {"execute_tools": "execute_tools", "finalize": "finalize"},
+        )
+        graph.add_edge("execute_tools", "generate_response")
+        graph.add_edge("finalize", END)
+        return graph.compile()
+
+    async def run_stream(self, user_input: str):
+        """Yield content deltas and state snapshots as the graph executes.
+
+        Items are either ``{"content_delta": text}`` — pushed from inside
+        generate_response while the provider is still streaming — or full
+        state snapshots after each node. Deltas carry all of the turn's
+        content; snapshot ``content`` is the assembled turn for callers
+        that only look at the final state.
+        """
+        initial: AgentState = {"input": user_input}
+        queue: asyncio.Queue = asyncio.Queue()
+        done = object()
+        self._delta_queue = queue
+
+        async def _drive() -> None:
+            try:
+                async for state in self._graph.astream(initial, stream_mode="values"):
+                    await queue.put(state)
+            finally:
+                await queue.put(done)
+
+        driver = asyncio.ensure_future(_drive())
+        try:
+            while True:
+                item = await queue.get()
+                if item is done:
+                    break
+                yield item
+            # Surface any graph error after the queue is drained.
+            await driver
+        finally:
+            self._delta_queue = None
+            if not driver.done():
+                driver.cancel()
+
+    async def run(self, user_input: str) -> AgentState:
+        """Run to completion and return the final state.
+
+        Goes straight through the graph without a delta queue, so
+        generate_response takes the non-streaming chat() path and keeps
+        its exact-match completion cache.
+        """
+        initial: AgentState = {"input": user_input}
+        final: AgentState = {}
+        async for state in self._graph.astream(initial, stream_mode="values"):
+            final = state
+        return final
+
+
+def create_agent_graph(llm, mcp_manager, semantic_cache=None) -> AgentGraph:
+    """Build the agent graph for one LLM conversation."""
+    return AgentGraph(llm, mcp_manager, semantic_cache=semantic_cache)
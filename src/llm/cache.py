@@ -0,0 +1,92 @@
+"""Exact-match response cache for LLM completions.
+
+Keys are a SHA-256 over the canonical (model, messages, tools) payload,
+so identical prompts — common in eval loops and deterministic tool
+chains — skip the provider round-trip entirely. By default only
+deterministic (temperature == 0) requests are cached.
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+from src.common.utils import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class InMemoryCache:
+    """TTL + LRU backend guarded by an asyncio.Lock."""
+
+    def __init__(self, maxsize: int = 256, ttl: float = 3600):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = asyncio.Lock()
+
+    async def get(self, key: str) -> Optional[Any]:
+        async with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    async def set(self, key: str, value: Any) -> None:
+        async with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    async def delete(self, key: str) -> None:
+        async with self._lock:
+            self._data.pop(key, None)
+
+
+class LLMCache:
+    """Fronts LLMInterface.chat with an exact-match completion cache."""
+
+    def __init__(self, backend=None, deterministic_only: bool = True):
+        self.backend = backend if backend is not None else InMemoryCache()
+        self.deterministic_only = deterministic_only
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(model: str, messages: List[Dict[str, Any]], tool_names: List[str]) -> str:
+        obj = {"model": model, "messages": messages, "tools": sorted(tool_names)}
+        if orjson is not None:
+            payload = orjson.dumps(obj, option=orjson.OPT_SORT_KEYS, default=str)
+        else:
+            payload = json.dumps(
+                obj, sort_keys=True, ensure_ascii=False, default=str
+            ).encode()
+        return hashlib.sha256(payload).hexdigest()
+
+    def should_cache(self, temperature: float) -> bool:
+        return not self.deterministic_only or temperature == 0
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        value = await self.backend.get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            logger.debug("LLM cache hit (%d hits / %d misses)", self.hits, self.misses)
+        return value
+
+    async def set(self, key: str, response: Dict[str, Any]) -> None:
+        await self.backend.set(key, response)
@@ -0,0 +1,211 @@
+"""Provider-agnostic LLM interface holding the conversation state."""
+
+import asyncio
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from src.common.config import config
+from src.common.utils import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class LLMInterface:
+    """Owns the message history and dispatches to the selected provider."""
+
+    def __init__(
+        self,
+        provider: str,
+        model: str,
+        system_prompt: Optional[str] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        cache=None,
+        max_history_turns: int = 20,
+        openai_tools: Optional[List[Dict[str, Any]]] = None,
+    ):
+        self.provider = provider
+        self.model = model
+        self.tools = tools or []
+        # Provider-ready schemas. Callers holding an MCPClientManager pass
+        # the registry's precomputed list; otherwise the transform runs
+        # once here rather than per provider call.
+        if openai_tools is not None:
+            self.openai_tools = openai_tools
+        else:
+            self.openai_tools = [
+                {
+                    "type": "function",
+                    "function": {
+                        "name": tool.get("name", ""),
+                        "description": tool.get("description", ""),
+                        "parameters": tool.get("inputSchema", {}),
+                    },
+                }
+                for tool in self.tools
+            ]
+        self.cache = cache
+        self.max_history_turns = max_history_turns
+        self.messages: List[Dict[str, Any]] = []
+        if system_prompt:
+            # Both shipped providers are OpenAI-style chat-completions
+            # endpoints, which do prompt-prefix caching automatically —
+            # no per-message annotation exists (Anthropic's cache_control
+            # is a different API and gets rejected inside content parts).
+            # Keeping the prefix byte-stable is what earns the cache hits.
+            self.messages.append({"role": "system", "content": system_prompt})
+        # Messages before this index are the frozen prefix: they must never
+        # be mutated between calls or the provider's prefix hash changes
+        # and cached KV state is thrown away.
+        self._static_prefix_len = len(self.messages)
+        if provider == "openai":
+            from src.llm.providers.openai import OpenAIProvider
+
+            self.provider_instance = OpenAIProvider(model)
+        elif provider == "nvidia":
+            from src.llm.providers.nvidia import NVIDIAProvider
+
+            self.provider_instance = NVIDIAProvider(model)
+        else:
+            raise ValueError(f"Unknown LLM provider: {provider}")
+
+    def _trim_history(self) -> None:
+        """Bound the resent history to the last ``max_history_turns`` turns.
+
+        Without a cap every turn resends the whole conversation, so prompt
+        cost grows quadratically over a long session. Trimming keeps the
+        static prefix intact (so provider-side prompt caching keeps
+        hitting) and drops the oldest middle of the conversation. The cut
+        point is nudged forward past any leading tool messages so a
+        tool_calls assistant turn is never separated from its results.
+        """
+        keep = 2 * self.max_history_turns
+        if len(self.messages) - self._static_prefix_len <= keep:
+            return
+        start = len(self.messages) - keep
+        while start < len(self.messages) and self.messages[start].get("role") == "tool":
+            start += 1
+        dropped = start - self._static_prefix_len
+        self.messages = self.messages[: self._static_prefix_len] + self.messages[start:]
+        logger.debug("Trimmed %d old messages from history", dropped)
+
+    async def chat(self, prompt: Optional[str] = None) -> Dict[str, Any]:
+        """Send the history (plus an optional new user turn) to the LLM."""
+        if prompt is not None:
+            self.messages.append({"role": "user", "content": prompt})
+        self._trim_history()
+        logger.debug("chat() with %d messages and %d tools", len(self.messages), len(self.tools))
+        cache_key = None
+        response = None
+        if self.cache is not None and self.cache.should_cache(config.llm.temperature):
+            cache_key = self.cache.make_key(
+                self.model, self.messages, [t.get("name", "") for t in self.tools]
+            )
+            response = await self.cache.get(cache_key)
+        if response is None:
+            response = await self.provider_instance.complete(
+                self.messages, tools=self.openai_tools
+            )
+            if cache_key is not None:
+                await self.cache.set(cache_key, response)
+        assistant_message: Dict[str, Any] = {
+            "role": "assistant",
+            "content": response.get("content", ""),
+        }
+        if response.get("tool_calls"):
+            assistant_message["tool_calls"] = [
+                {"id": tc["id"], "type": "function", "function": tc["function"]}
+                for tc in response["tool_calls"]
+            ]
+        self.messages.append(assistant_message)
+        return response
+
+    # Flush window for coalescing streamed deltas: short enough to keep
+    # output feeling live, long enough to amortize per-chunk overhead.
+    _STREAM_FLUSH_INTERVAL = 0.05
+    _STREAM_FLUSH_PARTS = 16
+
+    async def chat_stream(
+        self, prompt: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream a chat turn instead of awaiting the full completion.
+
+        Yields ``{"content": text}`` batches (content deltas coalesced
+        over a ~50 ms window) and a final ``{"tool_calls": [...]}`` when
+        the model requests tools, so callers can start dispatching tool
+        calls without waiting for end-of-stream. The assembled assistant
+        message is appended to the history exactly as chat() would.
+        """
+        if prompt is not None:
+            self.messages.append({"role": "user", "content": prompt})
+        self._trim_history()
+        queue: asyncio.Queue = asyncio.Queue()
+        done = object()
+
+        async def _produce() -> None:
+            try:
+                async for part in self.provider_instance.stream_complete(
+                    self.messages, tools=self.openai_tools
+                ):
+                    await queue.put(part)
+            finally:
+                await queue.put(done)
+
+        producer = asyncio.ensure_future(_produce())
+        content_parts: List[str] = []
+        tool_calls: List[Dict[str, Any]] = []
+        buffer: List[str] = []
+
+        def _drain_buffer() -> str:
+            text = "".join(buffer)
+            buffer.clear()
+            return text
+
+        try:
+            finished = False
+            while not finished:
+                try:
+                    part = await asyncio.wait_for(
+                        queue.get(), timeout=self._STREAM_FLUSH_INTERVAL
+                    )
+                except asyncio.TimeoutError:
+                    if buffer:
+                        yield {"content": _drain_buffer()}
+                    continue
+                if part is done:
+                    finished = True
+                elif "content" in part:
+                    buffer.append(part["content"])
+                    content_parts.append(part["content"])
+                    if len(buffer) >= self._STREAM_FLUSH_PARTS:
+                        yield {"content": _drain_buffer()}
+                elif part.get("tool_calls"):
+                    if buffer:
+                        yield {"content": _drain_buffer()}
+                    tool_calls = part["tool_calls"]
+                    yield {"tool_calls": tool_calls}
+            if buffer:
+                yield {"content": _drain_buffer()}
+            # Surface any provider error after the queue is drained.
+            await producer
+        finally:
+            if not producer.done():
+                producer.cancel()
+        assistant_message: Dict[str, Any] = {
+            "role": "assistant",
+            "content": "".join(content_parts),
+        }
+        if tool_calls:
+            assistant_message["tool_calls"] = [
+                {"id": tc["id"], "type": "function", "function": tc["function"]}
+                for tc in tool_calls
+            ]
+        self.messages.append(assistant_message)
+
+    def handle_tool_response(self, tool_call_id: str, result: str) -> None:
+        """Append a tool result so the next chat() sees it."""
+        self.messages.append(
+            {"role": "tool", "tool_call_id": tool_call_id, "content": result}
+        )
+
+    def reset(self) -> None:
+        """Drop everything but the system message."""
+        self.messages = [m for m in self.messages if m.get("role") == "system"]
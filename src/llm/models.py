@@ -0,0 +1,33 @@
+"""Data models shared by the LLM interface and the agent graph."""
+
+from dataclasses import dataclass
+from typing import Any, Dict
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional speedup
+    msgspec = None
+
+
+if msgspec is not None:
+
+    class ToolCall(msgspec.Struct, frozen=True):
+        """One tool invocation requested by the LLM.
+
+        A msgspec.Struct (slotted, no per-field validation) because one
+        instance is allocated per tool call on every agent round; the
+        pydantic fallback this replaced validated the full schema on
+        each construction.
+        """
+
+        id: str
+        function: Dict[str, Any]
+
+else:
+
+    @dataclass(slots=True, frozen=True)
+    class ToolCall:
+        """One tool invocation requested by the LLM."""
+
+        id: str
+        function: Dict[str, Any]
@@ -0,0 +1,24 @@
+"""Shared AsyncOpenAI construction for the OpenAI-compatible providers.
+
+Clients are cached per (base_url, api_key) so every provider pointed at
+the same endpoint reuses one HTTP connection pool, and the ``openai``
+import itself is deferred to first construction — it drags httpx,
+pydantic and anyio along, a cost deployments that never build this
+provider should not pay at import time.
+"""
+
+from typing import Any, Dict, Optional, Tuple
+
+_clients: Dict[Tuple[Optional[str], str], Any] = {}
+
+
+def get_async_client(base_url: Optional[str] = None, api_key: str = "") -> Any:
+    """Return the cached AsyncOpenAI for this endpoint, creating it once."""
+    key = (base_url, api_key)
+    client = _clients.get(key)
+    if client is None:
+        import openai
+
+        client = openai.AsyncOpenAI(base_url=base_url, api_key=api_key)
+        _clients[key] = client
+    return client
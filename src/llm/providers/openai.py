@@ -0,0 +1,101 @@
+"""OpenAI chat-completions provider."""
+
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from src.common.config import config
+from src.common.utils import setup_logger
+from src.llm.providers._client import get_async_client
+
+logger = setup_logger(__name__)
+
+
+class OpenAIProvider:
+    """Thin wrapper over the OpenAI chat completions API."""
+
+    def __init__(self, model: str):
+        self.model = model
+        self.client = get_async_client(api_key=config.llm.openai_api_key)
+
+    def _build_kwargs(
+        self,
+        messages: List[Dict[str, Any]],
+        tools: Optional[List[Dict[str, Any]]],
+        temperature: Optional[float],
+    ) -> Dict[str, Any]:
+        kwargs: Dict[str, Any] = {
+            "model": self.model,
+            "messages": messages,
+            "temperature": config.llm.temperature if temperature is None else temperature,
+        }
+        if tools:
+            # Already in OpenAI function-calling format: ToolRegistry
+            # precomputes the schemas at registration time.
+            kwargs["tools"] = tools
+        return kwargs
+
+    async def complete(
+        self,
+        messages: List[Dict[str, Any]],
+        tools: Optional[List[Dict[str, Any]]] = None,
+        temperature: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Run one completion and normalize the response."""
+        kwargs = self._build_kwargs(messages, tools, temperature)
+        logger.debug("OpenAI completion request with %d messages", len(messages))
+        response = await self.client.chat.completions.create(**kwargs)
+        usage = getattr(response, "usage", None)
+        details = getattr(usage, "prompt_tokens_details", None)
+        cached_tokens = getattr(details, "cached_tokens", None)
+        if cached_tokens:
+            logger.debug("Prompt cache served %s input tokens", cached_tokens)
+        message = response.choices[0].message
+        return {
+            "content": message.content or "",
+            "tool_calls": [
+                {
+                    "id": tc.id,
+                    "function": {
+                        "name": tc.function.name,
+                        "arguments": tc.function.arguments,
+                    },
+                }
+                for tc in (message.tool_calls or ())
+            ],
+        }
+
+    async def stream_complete(
+        self,
+        messages: List[Dict[str, Any]],
+        tools: Optional[List[Dict[str, Any]]] = None,
+        temperature: Optional[float] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream a completion as it is generated.
+
+        Yields ``{"content": delta}`` for each text delta and, once the
+        stream ends, a single ``{"tool_calls": [...]}`` with the tool
+        calls assembled from their argument fragments.
+        """
+        kwargs = self._build_kwargs(messages, tools, temperature)
+        kwargs["stream"] = True
+        logger.debug("OpenAI streaming request with %d messages", len(messages))
+        stream = await self.client.chat.completions.create(**kwargs)
+        pending: Dict[int, Dict[str, Any]] = {}
+        async for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta
+            if delta.content:
+                yield {"content": delta.content}
+            for tc in delta.tool_calls or ():
+                entry = pending.setdefault(
+                    tc.index, {"id": "", "function": {"name": "", "arguments": ""}}
+                )
+                if tc.id:
+                    entry["id"] = tc.id
+                if tc.function:
+                    if tc.function.name:
+                        entry["function"]["name"] += tc.function.name
+                    if tc.function.arguments:
+                        entry["function"]["arguments"] += tc.function.arguments
+        if pending:
+            yield {"tool_calls": [pending[i] for i in sorted(pending)]}
@@ -0,0 +1,82 @@
+"""Semantic cache that short-circuits LLM calls for repeat questions.
+
+Prompts are embedded with the configured embedding model; a query whose
+embedding lands within ``max_distance`` (cosine) of a cached prompt gets
+the cached response back without an LLM round-trip. Tool-using turns are
+never cached by the caller since those depend on live data.
+"""
+
+import time
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from src.common.config import config
+from src.common.utils import setup_logger
+from src.rag.embeddings.models import get_embedding_model
+
+logger = setup_logger(__name__)
+
+
+class SemanticCache:
+    """In-process embedding-keyed response cache with TTL."""
+
+    def __init__(
+        self,
+        model_name: Optional[str] = None,
+        max_distance: float = 0.1,
+        ttl: int = 3600,
+        maxsize: int = 512,
+    ):
+        self.model = get_embedding_model(model_name or config.rag.embedding_model)
+        self.max_distance = max_distance
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._embeddings: List[np.ndarray] = []
+        self._entries: List[Tuple[float, str]] = []  # (expires_at, response)
+        self._last_embedded: Optional[Tuple[str, np.ndarray]] = None
+        self.hits = 0
+        self.misses = 0
+
+    async def _embed(self, prompt: str) -> np.ndarray:
+        if self._last_embedded is not None and self._last_embedded[0] == prompt:
+            return self._last_embedded[1]
+        raw = await self.model.embed_text(prompt)
+        embedding = np.asarray(raw, dtype=np.float32)
+        norm = np.linalg.norm(embedding)
+        if norm > 0:
+            embedding /= norm
+        self._last_embedded = (prompt, embedding)
+        return embedding
+
+    def _prune(self) -> None:
+        now = time.monotonic()
+        keep = [i for i, (expires, _) in enumerate(self._entries) if expires > now]
+        if len(keep) != len(self._entries):
+            self._embeddings = [self._embeddings[i] for i in keep]
+            self._entries = [self._entries[i] for i in keep]
+
+    async def get(self, prompt: str) -> Optional[str]:
+        """Return a cached response for a semantically-equal prompt."""
+        self._prune()
+        if not self._entries:
+            self.misses += 1
+            return None
+        embedding = await self._embed(prompt)
+        sims = np.vstack(self._embeddings) @ embedding
+        best = int(np.argmax(sims))
+        if 1.0 - float(sims[best]) <= self.max_distance:
+            self.hits += 1
+            logger.debug("Semantic cache hit (similarity=%.3f)", float(sims[best]))
+            return self._entries[best][1]
+        self.misses += 1
+        return None
+
+    async def set(self, prompt: str, response: str) -> None:
+        """Store a response under the prompt's embedding."""
+        embedding = await self._embed(prompt)
+        self._embeddings.append(embedding)
+        self._entries.append((time.monotonic() + self.ttl, response))
+        if len(self._entries) > self.maxsize:
+            self._embeddings.pop(0)
+            self._entries.pop(0)
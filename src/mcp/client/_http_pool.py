@@ -0,0 +1,39 @@
+"""Process-wide httpx.AsyncClient shared by MCP HTTP traffic.
+
+One pool means keep-alive connections are reused across every MCP
+client and server-side outbound call instead of paying DNS + TCP + TLS
+per request. HTTP/2 is enabled when the h2 package is installed.
+"""
+
+from typing import Optional
+
+import httpx
+
+from src.common.config import config
+
+_shared_client: Optional[httpx.AsyncClient] = None
+
+
+def get_shared_client() -> httpx.AsyncClient:
+    """Return the lazily-constructed shared client."""
+    global _shared_client
+    if _shared_client is None:
+        limits = httpx.Limits(
+            max_connections=config.server.pool_size,
+            max_keepalive_connections=max(config.server.pool_size // 2, 1),
+            keepalive_expiry=30,
+        )
+        timeout = httpx.Timeout(30.0, connect=5.0)
+        try:
+            _shared_client = httpx.AsyncClient(http2=True, limits=limits, timeout=timeout)
+        except ImportError:
+            _shared_client = httpx.AsyncClient(limits=limits, timeout=timeout)
+    return _shared_client
+
+
+async def aclose_shared_client() -> None:
+    """Close the shared client (process shutdown only)."""
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.aclose()
+        _shared_client = None
@@ -0,0 +1,96 @@
+"""HTTP client for MCP servers exposed over streamable HTTP."""
+
+import json
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+from src.common.utils import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class MCPHttpClient:
+    """Talks JSON-RPC to a single MCP server mounted at ``url``."""
+
+    def __init__(self, name: str, url: str, client: Optional[httpx.AsyncClient] = None):
+        self.name = name
+        self.url = url.rstrip("/")
+        # A shared client (passed by MCPClientManager) keeps one keep-alive
+        # pool across all MCP servers; a private one is created otherwise.
+        self._owns_client = client is None
+        self.client = client if client is not None else httpx.AsyncClient()
+        self.tools: List[Dict[str, Any]] = []
+        self._request_id = 0
+
+    async def _rpc(self, method: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """Send one JSON-RPC request and return its ``result`` payload."""
+        self._request_id += 1
+        payload = {
+            "jsonrpc": "2.0",
+            "id": self._request_id,
+            "method": method,
+            "params": params or {},
+        }
+        logger.debug("RPC %s to '%s' with params: %s", method, self.name, params)
+        # Serialize/deserialize with orjson when available: both sides of
+        # the RPC are on the per-tool-call hot path.
+        if orjson is not None:
+            body = orjson.dumps(payload)
+        else:
+            body = json.dumps(payload).encode()
+        response = await self.client.post(
+            self.url,
+            content=body,
+            headers={
+                "Content-Type": "application/json",
+                "Accept": "application/json, text/event-stream",
+            },
+        )
+        response.raise_for_status()
+        if orjson is not None:
+            data = orjson.loads(response.content)
+        else:
+            data = response.json()
+        if "error" in data:
+            raise RuntimeError(f"MCP server '{self.name}' error: {data['error']}")
+        return data.get("result")
+
+    async def init(self) -> bool:
+        """Run the MCP handshake and fetch the server's tool list."""
+        try:
+            await self._rpc(
+                "initialize",
+                {
+                    "protocolVersion": "2024-11-05",
+                    "clientInfo": {"name": "mcp-rag-agent", "version": "0.1.0"},
+                    "capabilities": {},
+                },
+            )
+            result = await self._rpc("tools/list")
+            self.tools = result.get("tools", []) if result else []
+            logger.info(f"Connected to MCP server '{self.name}' ({len(self.tools)} tools)")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to initialize MCP server '{self.name}': {e}")
+            return False
+
+    async def call_tool(self, name: str, params: Dict[str, Any]) -> Any:
+        """Invoke a tool on this server and return its result content."""
+        logger.debug("Calling tool '%s' on HTTP MCP server '%s' with params: %s", name, self.name, params)
+        result = await self._rpc("tools/call", {"name": name, "arguments": params})
+        if result and "content" in result:
+            content = result["content"]
+            if isinstance(content, list) and content and content[0].get("type") == "text":
+                return content[0].get("text", "")
+            return content
+        return result
+
+    async def close(self) -> None:
+        if self._owns_client:
+            await self.client.aclose()
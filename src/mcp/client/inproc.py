@@ -0,0 +1,54 @@
+"""In-process client for MCP servers living in the same interpreter.
+
+When the agent runs co-located with the MCP servers (src.app mounts all
+four on one FastAPI app), going through HTTP means serializing JSON over
+a loopback socket to ourselves. This client invokes the FastMCP tool
+dispatch directly as a coroutine, skipping ASGI, HTTP framing and wire
+serialization entirely.
+"""
+
+from typing import Any, Dict, List
+
+from src.common.utils import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class MCPInprocClient:
+    """Dispatches tool calls straight into a FastMCP instance."""
+
+    def __init__(self, name: str, mcp_instance):
+        self.name = name
+        self.mcp = mcp_instance
+        self.tools: List[Dict[str, Any]] = []
+
+    async def init(self) -> bool:
+        """List the server's tools without any transport."""
+        try:
+            listed = await self.mcp.list_tools()
+            self.tools = [
+                {
+                    "name": tool.name,
+                    "description": tool.description or "",
+                    "inputSchema": tool.inputSchema,
+                }
+                for tool in listed
+            ]
+            logger.info(f"Attached in-proc MCP server '{self.name}' ({len(self.tools)} tools)")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to attach in-proc MCP server '{self.name}': {e}")
+            return False
+
+    async def call_tool(self, name: str, params: Dict[str, Any]) -> Any:
+        """Invoke the tool coroutine directly and unwrap its content."""
+        logger.debug("Calling tool '%s' on in-proc MCP server '%s' with params: %s", name, self.name, params)
+        result = await self.mcp.call_tool(name, params)
+        if isinstance(result, (list, tuple)) and result:
+            first = result[0]
+            if getattr(first, "type", None) == "text":
+                return getattr(first, "text", "")
+        return result
+
+    async def close(self) -> None:
+        """Nothing to release; the server owns its own lifecycle."""
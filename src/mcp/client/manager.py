@@ -0,0 +1,208 @@
+"""Manager owning the MCP clients and the shared tool registry."""
+
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    from aiolimiter import AsyncLimiter
+except ImportError:  # pragma: no cover - optional dependency
+    AsyncLimiter = None
+
+from src.common.config import config
+from src.common.utils import setup_logger
+from src.mcp.client._http_pool import aclose_shared_client, get_shared_client
+from src.mcp.client.http import MCPHttpClient
+from src.mcp.client.inproc import MCPInprocClient
+from src.mcp.client.registry import ToolRegistry
+from src.mcp.client.stdio import MCPStdioClient
+
+logger = setup_logger(__name__)
+
+
+class MCPClientManager:
+    """Creates MCP clients, routes tool calls and handles shutdown."""
+
+    def __init__(self):
+        self.clients: Dict[str, Any] = {}
+        self.registry = ToolRegistry()
+        # get_all_tools is called on every session init but the tool set
+        # only changes when clients come and go, so memoize it.
+        self._tools_cache: Optional[List[Dict[str, Any]]] = None
+        self._tools_version: int = 0
+        # Bound in-flight tool calls so a fan-out turn cannot exhaust the
+        # MCP servers or upstream API quotas.
+        self._sem = asyncio.Semaphore(config.server.mcp_concurrency)
+        # Optional requests-per-minute cap on top of the concurrency
+        # bound, for MCP servers fronting quota-limited upstream APIs.
+        self._limiter = None
+        if config.server.mcp_rpm > 0:
+            if AsyncLimiter is not None:
+                self._limiter = AsyncLimiter(config.server.mcp_rpm, 60)
+            else:
+                logger.warning("MCP_RPM is set but aiolimiter is not installed")
+        # The process-wide pooled client: calls to the co-mounted servers
+        # reuse keep-alive connections instead of paying a TCP/TLS
+        # handshake per server per call.
+        self._http_client = get_shared_client()
+        # One watcher task per stdio client, restarting its subprocess
+        # if it dies underneath us.
+        self._supervisors: Dict[str, asyncio.Task] = {}
+
+    async def create_client_http(self, name: str, url: str) -> Optional[MCPHttpClient]:
+        """Connect to an HTTP MCP server and register its tools."""
+        client = MCPHttpClient(name, url, client=self._http_client)
+        if not await client.init():
+            await client.close()
+            return None
+        self.clients[name] = client
+        for tool in client.tools:
+            self.registry.register_tool(name, tool)
+        self._invalidate_tools_cache()
+        return client
+
+    async def create_client_inproc(self, name: str, mcp_instance) -> Optional[MCPInprocClient]:
+        """Attach a co-located FastMCP server without any transport."""
+        client = MCPInprocClient(name, mcp_instance)
+        if not await client.init():
+            return None
+        self.clients[name] = client
+        for tool in client.tools:
+            self.registry.register_tool(name, tool)
+        self._invalidate_tools_cache()
+        return client
+
+    async def create_client_stdio(
+        self, name: str, command: str, args: Optional[List[str]] = None
+    ) -> Optional[MCPStdioClient]:
+        """Spawn a stdio MCP server and register its tools."""
+        client = MCPStdioClient(name, command, args)
+        if not await client.init():
+            return None
+        self.clients[name] = client
+        for tool in client.tools:
+            self.registry.register_tool(name, tool)
+        self._invalidate_tools_cache()
+        self._supervisors[name] = asyncio.create_task(self._supervise(name))
+        return client
+
+    async def _supervise(self, name: str) -> None:
+        """Restart a stdio server whose subprocess exits unexpectedly.
+
+        A crash only takes down the one server: its tools are
+        unregistered while it is down and re-registered after a
+        successful restart, leaving the other clients untouched.
+        """
+        while True:
+            client = self.clients.get(name)
+            if client is None or client.process is None:
+                return
+            process = client.process
+            await process.wait()
+            # close() reaps the process itself; only an exit while the
+            # client still considers that process live is a crash.
+            if self.clients.get(name) is not client or client.process is not process:
+                return
+            logger.warning(f"Stdio MCP server '{name}' exited; restarting")
+            client.process = None
+            self.registry.unregister_client(name)
+            self._invalidate_tools_cache()
+            backoff = 1.0
+            while not await client.init():
+                if self.clients.get(name) is not client:
+                    return
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 30.0)
+            for tool in client.tools:
+                self.registry.register_tool(name, tool)
+            self._invalidate_tools_cache()
+            logger.info(f"Stdio MCP server '{name}' restarted")
+
+    async def create_clients(self, configs: List[Dict[str, Any]]) -> List[Any]:
+        """Create a batch of clients concurrently.
+
+        Each config carries a ``transport`` key ("http", "stdio" or
+        "inproc") plus the arguments of the matching create_client_*
+        method; results come back in config order.
+        """
+        coros = []
+        for cfg in configs:
+            transport = cfg.get("transport", "http")
+            if transport == "http":
+                coros.append(self.create_client_http(cfg["name"], cfg["url"]))
+            elif transport == "stdio":
+                coros.append(
+                    self.create_client_stdio(cfg["name"], cfg["command"], cfg.get("args"))
+                )
+            elif transport == "inproc":
+                coros.append(self.create_client_inproc(cfg["name"], cfg["mcp"]))
+            else:
+                raise ValueError(f"Unknown MCP transport: {transport}")
+        return list(await asyncio.gather(*coros))
+
+    async def start_all(self, configs: List[Dict[str, Any]]) -> List[Any]:
+        """Warm-start every configured server concurrently.
+
+        Alias of create_clients with startup semantics spelled out:
+        stdio subprocesses spawn and handshake in parallel with the
+        HTTP/in-proc connections instead of paying each cold start
+        serially, and each stdio client comes up supervised.
+        """
+        return await self.create_clients(configs)
+
+    async def call_tool(self, tool_name: str, params: Dict[str, Any]) -> Any:
+        """Route a tool call to the client that registered the tool."""
+        client_name = self.registry.get_client_for_tool(tool_name)
+        if client_name is None:
+            raise ValueError(f"Unknown tool: {tool_name}")
+        client = self.clients[client_name]
+        if self._limiter is not None:
+            await self._limiter.acquire()
+        async with self._sem:
+            return await client.call_tool(tool_name, params)
+
+    async def batch_call_tool(
+        self, calls: List[Tuple[str, Dict[str, Any]]]
+    ) -> List[Any]:
+        """Run several tool calls concurrently, results in call order.
+
+        The semaphore and rate limiter inside call_tool keep a large
+        fan-out turn from overrunning the servers; failures come back
+        in-slot as exceptions rather than cancelling the whole batch.
+        """
+        return list(
+            await asyncio.gather(
+                *[self.call_tool(name, params) for name, params in calls],
+                return_exceptions=True,
+            )
+        )
+
+    def _invalidate_tools_cache(self) -> None:
+        self._tools_cache = None
+        self._tools_version += 1
+
+    def get_all_tools(self) -> List[Dict[str, Any]]:
+        """Return the tool schemas from every connected client (cached)."""
+        if self._tools_cache is None:
+            self._tools_cache = self.registry.list_tools()
+        return self._tools_cache
+
+    def get_openai_tools(self) -> List[Dict[str, Any]]:
+        """Return the provider-ready OpenAI schemas (precomputed)."""
+        return self.registry.list_openai_schemas()
+
+    async def close_all(self) -> None:
+        """Close every client concurrently and clear the registry."""
+        for task in self._supervisors.values():
+            task.cancel()
+        self._supervisors.clear()
+        names = list(self.clients)
+        results = await asyncio.gather(
+            *[self.clients[name].close() for name in names], return_exceptions=True
+        )
+        for name, result in zip(names, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error closing MCP client '{name}': {result}")
+            self.registry.unregister_client(name)
+        self.clients.clear()
+        self._invalidate_tools_cache()
+        await aclose_shared_client()
@@ -0,0 +1,72 @@
+"""Registry mapping tool names to the MCP client that provides them."""
+
+from typing import Any, Dict, List, Optional
+
+from src.common.utils import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class ToolRegistry:
+    """Tracks which client owns each tool exposed to the LLM."""
+
+    def __init__(self):
+        self.tools: Dict[str, Dict[str, Any]] = {}
+        # list_tools()/list_openai_schemas() sit on the per-request path;
+        # the materialized lists only change when tools come and go.
+        self._tools_list_cache: Optional[List[Dict[str, Any]]] = None
+        self._schemas_list_cache: Optional[List[Dict[str, Any]]] = None
+
+    def register_tool(self, client_name: str, tool: Dict[str, Any]) -> None:
+        """Register one tool schema under the client that serves it."""
+        tool_name = tool.get("name")
+        if not tool_name:
+            logger.warning(f"Skipping tool without a name from client '{client_name}'")
+            return
+        if tool_name in self.tools:
+            logger.warning(f"Tool '{tool_name}' re-registered by client '{client_name}'")
+        # The OpenAI function-calling shape is computed once here so no
+        # per-request code ever rebuilds it.
+        openai_schema = {
+            "type": "function",
+            "function": {
+                "name": tool_name,
+                "description": tool.get("description", ""),
+                "parameters": tool.get("inputSchema", {}),
+            },
+        }
+        self.tools[tool_name] = {
+            "tool": tool,
+            "client_name": client_name,
+            "openai_schema": openai_schema,
+        }
+        self._tools_list_cache = None
+        self._schemas_list_cache = None
+
+    def unregister_client(self, client_name: str) -> None:
+        """Drop every tool registered by ``client_name``."""
+        stale = [name for name, info in self.tools.items() if info["client_name"] == client_name]
+        for name in stale:
+            del self.tools[name]
+        if stale:
+            self._tools_list_cache = None
+            self._schemas_list_cache = None
+
+    def get_client_for_tool(self, tool_name: str) -> Optional[str]:
+        """Return the owning client's name, or None if unknown."""
+        info = self.tools.get(tool_name)
+        return info["client_name"] if info else None
+
+    def list_tools(self) -> List[Dict[str, Any]]:
+        """Return the raw MCP tool schemas for every registered tool."""
+        if self._tools_list_cache is None:
+            self._tools_list_cache = [info["tool"] for info in self.tools.values()]
+        return self._tools_list_cache
+
+    def list_openai_schemas(self) -> List[Dict[str, Any]]:
+        """Return the precomputed OpenAI-format schema for every tool."""
+        if self._schemas_list_cache is None:
+            self._schemas_list_cache = [
+                info["openai_schema"] for info in self.tools.values()
+            ]
+        return self._schemas_list_cache
@@ -0,0 +1,91 @@
+"""Stdio client for MCP servers launched as subprocesses."""
+
+import asyncio
+import json
+from typing import Any, Dict, List, Optional
+
+from src.common.utils import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class MCPStdioClient:
+    """Talks JSON-RPC over stdin/stdout to a spawned MCP server process."""
+
+    def __init__(self, name: str, command: str, args: Optional[List[str]] = None):
+        self.name = name
+        self.command = command
+        self.args = args or []
+        self.process: Optional[asyncio.subprocess.Process] = None
+        self.tools: List[Dict[str, Any]] = []
+        self._request_id = 0
+
+    async def _rpc(self, method: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """Send one JSON-RPC request over the pipe and await its response."""
+        if self.process is None or self.process.stdin is None or self.process.stdout is None:
+            raise RuntimeError(f"MCP stdio server '{self.name}' is not running")
+        self._request_id += 1
+        payload = {
+            "jsonrpc": "2.0",
+            "id": self._request_id,
+            "method": method,
+            "params": params or {},
+        }
+        logger.debug("RPC %s to stdio server '%s' with params: %s", method, self.name, params)
+        self.process.stdin.write(json.dumps(payload).encode() + b"\n")
+        await self.process.stdin.drain()
+        line = await self.process.stdout.readline()
+        if not line:
+            raise RuntimeError(f"MCP stdio server '{self.name}' closed its pipe")
+        data = json.loads(line)
+        if "error" in data:
+            raise RuntimeError(f"MCP server '{self.name}' error: {data['error']}")
+        return data.get("result")
+
+    async def init(self) -> bool:
+        """Spawn the subprocess, run the handshake and fetch tools."""
+        try:
+            self.process = await asyncio.create_subprocess_exec(
+                self.command,
+                *self.args,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+            await self._rpc(
+                "initialize",
+                {
+                    "protocolVersion": "2024-11-05",
+                    "clientInfo": {"name": "mcp-rag-agent", "version": "0.1.0"},
+                    "capabilities": {},
+                },
+            )
+            result = await self._rpc("tools/list")
+            self.tools = result.get("tools", []) if result else []
+            logger.info(f"Started stdio MCP server '{self.name}' ({len(self.tools)} tools)")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to start stdio MCP server '{self.name}': {e}")
+            return False
+
+    async def call_tool(self, name: str, params: Dict[str, Any]) -> Any:
+        """Invoke a tool on the subprocess and return its result content."""
+        logger.debug("Calling tool '%s' on stdio MCP server '%s' with params: %s", name, self.name, params)
+        result = await self._rpc("tools/call", {"name": name, "arguments": params})
+        if result and "content" in result:
+            content = result["content"]
+            if isinstance(content, list) and content and content[0].get("type") == "text":
+                return content[0].get("text", "")
+            return content
+        return result
+
+    async def close(self) -> None:
+        if self.process is not None:
+            if self.process.stdin is not None:
+                self.process.stdin.close()
+            try:
+                await asyncio.wait_for(self.process.wait(), timeout=5)
+            except asyncio.TimeoutError:
+                self.process.kill()
+                await self.process.wait()
+            self.process = None
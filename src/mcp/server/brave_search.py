@@ -0,0 +1,75 @@
+"""Brave Search MCP server: web search tool."""
+
+import os
+from typing import Any, Dict, List
+
+from mcp.server.fastmcp import Context, FastMCP
+
+from src.common.utils import setup_logger
+from src.llm.cache import InMemoryCache
+from src.mcp.client._http_pool import get_shared_client
+
+logger = setup_logger(__name__)
+
+brave_search_mcp = FastMCP("brave-search")
+
+BRAVE_SEARCH_KEY = os.getenv("BRAVE_SEARCH_KEY", "")
+
+_BRAVE_URL = "https://api.search.brave.com/res/v1/web/search"
+# Built once: the key never changes after import, so there is no reason
+# to allocate a fresh headers dict per search.
+_BRAVE_HEADERS = {
+    "Accept": "application/json",
+    "X-Subscription-Token": BRAVE_SEARCH_KEY,
+}
+
+# Agent loops retry and re-plan with identical queries within seconds;
+# a short TTL makes those free without serving stale results for long.
+_SEARCH_CACHE = InMemoryCache(
+    maxsize=1024, ttl=float(os.getenv("BRAVE_CACHE_TTL", "300"))
+)
+
+
+def format_search_results(results: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Reduce a Brave API response to the fields the agent needs."""
+    web_results = (results.get("web") or {}).get("results") or []
+    # Preallocate and fill by index: no per-result append dispatch or
+    # list regrowth when count is large.
+    formatted: List[Dict[str, Any]] = [None] * len(web_results)
+    for i, result in enumerate(web_results):
+        formatted[i] = {
+            "title": result.get("title", ""),
+            "description": result.get("description", ""),
+            "url": result.get("url", ""),
+            "is_family_friendly": result.get("is_family_friendly", True),
+            "published_date": result.get("published_date", ""),
+        }
+    return formatted
+
+
+@brave_search_mcp.tool()
+async def search_web(query: str, count: int = 10, ctx: Context = None) -> Dict[str, Any]:
+    """Search the web via the Brave Search API."""
+    if not BRAVE_SEARCH_KEY:
+        return {"success": False, "error": "BRAVE_SEARCH_KEY is not set"}
+    cache_key = f"{query.casefold().strip()}|{count}"
+    cached = await _SEARCH_CACHE.get(cache_key)
+    if cached is not None:
+        logger.debug("Search cache hit for query '%s'", query)
+        return cached
+    try:
+        # Shared pooled client: repeated searches skip the TLS handshake.
+        response = await get_shared_client().get(
+            _BRAVE_URL,
+            headers=_BRAVE_HEADERS,
+            params={"q": query, "count": count},
+        )
+        response.raise_for_status()
+        results = response.json()
+        payload = {"success": True, "results": format_search_results(results)}
+        # Only successes are cached so a transient error is never pinned.
+        await _SEARCH_CACHE.set(cache_key, payload)
+        return payload
+    except Exception as e:
+        logger.error(f"search_web failed for query '{query}': {e}")
+        return {"success": False, "error": str(e)}
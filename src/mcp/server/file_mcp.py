@@ -0,0 +1,78 @@
+"""File MCP server: sandboxed read/write/list tools."""
+
+import asyncio
+import os
+from pathlib import Path
+from typing import Any, Dict
+
+from mcp.server.fastmcp import Context, FastMCP
+
+from src.common.utils import setup_logger
+from src.mcp.server.lifespan import file_lifespan
+
+logger = setup_logger(__name__)
+
+file_mcp = FastMCP("file", lifespan=file_lifespan)
+
+BASE_PATH = Path(os.getenv("FILE_MCP_ROOT", "workspace")).resolve()
+
+
+def _resolve(path: str) -> Path:
+    """Resolve a user path inside the sandbox, refusing escapes."""
+    full_path = (BASE_PATH / path).resolve()
+    if not str(full_path).startswith(str(BASE_PATH)):
+        raise ValueError(f"Path escapes the sandbox: {path}")
+    return full_path
+
+
+@file_mcp.tool()
+async def read_file(path: str, ctx: Context = None) -> Dict[str, Any]:
+    """Read a text file from the sandbox."""
+    try:
+        full_path = _resolve(path)
+        # Blocking disk I/O goes to the default thread pool so one slow
+        # read does not serialize every other tool call on the loop.
+        content = await asyncio.to_thread(full_path.read_text, encoding="utf-8")
+        return {"success": True, "content": content}
+    except Exception as e:
+        logger.error(f"read_file failed for {path}: {e}")
+        return {"success": False, "error": str(e)}
+
+
+@file_mcp.tool()
+async def write_file(path: str, content: str, ctx: Context = None) -> Dict[str, Any]:
+    """Write a text file into the sandbox."""
+    try:
+        full_path = _resolve(path)
+        full_path.parent.mkdir(parents=True, exist_ok=True)
+        await asyncio.to_thread(full_path.write_text, content, encoding="utf-8")
+        return {"success": True, "path": str(full_path)}
+    except Exception as e:
+        logger.error(f"write_file failed for {path}: {e}")
+        return {"success": False, "error": str(e)}
+
+
+def _scan_dir(full_path: Path) -> list:
+    # os.scandir reuses the dirent data from one getdents64 pass instead
+    # of allocating a Path and stat()ing every entry like glob does.
+    with os.scandir(full_path) as it:
+        return [os.path.relpath(entry.path, BASE_PATH) for entry in it]
+
+
+@file_mcp.tool()
+async def list_files(ctx: Context, directory: str = "") -> Dict[str, Any]:
+    """List files under a sandbox directory."""
+    try:
+        full_path = _resolve(directory)
+        files = await asyncio.to_thread(_scan_dir, full_path)
+        return {"success": True, "files": files}
+    except Exception as e:
+        logger.error(f"list_files failed for {directory}: {e}")
+        return {"success": False, "error": str(e)}
+
+
+@file_mcp.resource("file://{path}")
+async def get_file_content(path: str) -> str:
+    """Expose sandbox files as MCP resources."""
+    full_path = _resolve(path)
+    return await asyncio.to_thread(full_path.read_text, encoding="utf-8")
@@ -0,0 +1,155 @@
+"""Google Maps MCP server: place search and directions tools."""
+
+import asyncio
+import os
+from typing import Any, Dict, List
+
+from mcp.server.fastmcp import Context, FastMCP
+
+from src.common.utils import json_loads, setup_logger
+from src.llm.cache import InMemoryCache
+from src.mcp.client._http_pool import get_shared_client
+
+logger = setup_logger(__name__)
+
+google_maps_mcp = FastMCP("google-maps")
+
+GOOGLE_MAPS_KEY = os.getenv("GOOGLE_MAPS_KEY", "")
+
+# Places and directions barely change hour to hour; a bounded TTL cache
+# turns repeated lookups into dict hits instead of API round-trips
+# (finite TTL keeps us inside Google's no-indefinite-storage terms).
+_MAPS_CACHE = InMemoryCache(
+    maxsize=4096, ttl=float(os.getenv("MAPS_CACHE_TTL", "3600"))
+)
+
+PLACES_URL = "https://maps.googleapis.com/maps/api/place/textsearch/json"
+DIRECTIONS_URL = "https://maps.googleapis.com/maps/api/directions/json"
+
+# Bounds in-flight Maps requests. Kept separate from the RAG server's
+# semaphore so embedding bursts never starve map lookups (and vice
+# versa), and sized to stay under Google's per-second quota.
+_MAPS_SEMAPHORE = asyncio.Semaphore(
+    int(os.getenv("GOOGLE_MAPS_MAX_CONCURRENCY", "8"))
+)
+
+
+# Shared fallback for absent nested objects: the chained
+# .get(..., {}).get(...) idiom allocates a throwaway dict per missing
+# field per item, which adds up across large result pages.
+_EMPTY: Dict[str, Any] = {}
+
+
+def format_places_results(results: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Reduce a Places API response to the fields the agent needs."""
+    places = results.get("results") or []
+    # Preallocate and fill by index, and resolve each nested object
+    # once per place instead of once per field.
+    formatted: List[Dict[str, Any]] = [None] * len(places)
+    for i, place in enumerate(places):
+        location = (place.get("geometry") or _EMPTY).get("location") or _EMPTY
+        opening_hours = place.get("opening_hours") or _EMPTY
+        formatted[i] = {
+            "name": place.get("name", ""),
+            "address": place.get("formatted_address", place.get("vicinity", "")),
+            "rating": place.get("rating", "Not rated"),
+            "lat": location.get("lat"),
+            "lng": location.get("lng"),
+            "place_id": place.get("place_id", ""),
+            "types": place.get("types", []),
+            "open_now": opening_hours.get("open_now"),
+        }
+    return formatted
+
+
+def format_directions_results(results: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Reduce a Directions API response to per-step instructions."""
+    formatted: List[Dict[str, Any]] = []
+    for route in results.get("routes") or ():
+        for leg in route.get("legs") or ():
+            leg_steps = leg.get("steps") or []
+            steps: List[Dict[str, Any]] = [None] * len(leg_steps)
+            for i, step in enumerate(leg_steps):
+                steps[i] = {
+                    "instruction": step.get("html_instructions", ""),
+                    "distance": (step.get("distance") or _EMPTY).get("text", ""),
+                    "duration": (step.get("duration") or _EMPTY).get("text", ""),
+                }
+            formatted.append(
+                {
+                    "start_address": leg.get("start_address", ""),
+                    "end_address": leg.get("end_address", ""),
+                    "distance": (leg.get("distance") or _EMPTY).get("text", ""),
+                    "duration": (leg.get("duration") or _EMPTY).get("text", ""),
+                    "steps": steps,
+                }
+            )
+    return formatted
+
+
+@google_maps_mcp.tool()
+async def search_places(
+    query: str, location: str = "", radius: int = 5000, ctx: Context = None
+) -> Dict[str, Any]:
+    """Search for places matching a text query."""
+    if not GOOGLE_MAPS_KEY:
+        return {"success": False, "error": "GOOGLE_MAPS_KEY is not set"}
+    params = {"query": query, "key": GOOGLE_MAPS_KEY}
+    if location:
+        params["location"] = location
+        params["radius"] = radius
+    cache_key = f"places|{query}|{location}|{radius}"
+    cached = await _MAPS_CACHE.get(cache_key)
+    if cached is not None:
+        logger.debug("Places cache hit for query '%s'", query)
+        return cached
+    try:
+        # Shared pooled client: repeated lookups reuse one keep-alive
+        # connection instead of a TCP+TLS handshake per call.
+        async with _MAPS_SEMAPHORE:
+            response = await get_shared_client().get(PLACES_URL, params=params)
+        response.raise_for_status()
+        places_results = json_loads(response.content)
+        payload = {"success": True, "places": format_places_results(places_results)}
+        # Failures are returned but never cached.
+        await _MAPS_CACHE.set(cache_key, payload)
+        return payload
+    except Exception as e:
+        logger.error(f"search_places failed for query '{query}': {e}")
+        return {"success": False, "error": str(e)}
+
+
+@google_maps_mcp.tool()
+async def get_directions(
+    origin: str, destination: str, mode: str = "driving", ctx: Context = None
+) -> Dict[str, Any]:
+    """Get directions between two locations."""
+    if not GOOGLE_MAPS_KEY:
+        return {"success": False, "error": "GOOGLE_MAPS_KEY is not set"}
+    cache_key = f"directions|{origin}|{destination}|{mode}"
+    cached = await _MAPS_CACHE.get(cache_key)
+    if cached is not None:
+        logger.debug("Directions cache hit (%s -> %s)", origin, destination)
+        return cached
+    try:
+        async with _MAPS_SEMAPHORE:
+            response = await get_shared_client().get(
+                DIRECTIONS_URL,
+                params={
+                    "origin": origin,
+                    "destination": destination,
+                    "mode": mode,
+                    "key": GOOGLE_MAPS_KEY,
+                },
+            )
+        response.raise_for_status()
+        directions_results = json_loads(response.content)
+        payload = {
+            "success": True,
+            "routes": format_directions_results(directions_results),
+        }
+        await _MAPS_CACHE.set(cache_key, payload)
+        return payload
+    except Exception as e:
+        logger.error(f"get_directions failed ({origin} -> {destination}): {e}")
+        return {"success": False, "error": str(e)}
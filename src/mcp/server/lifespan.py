@@ -0,0 +1,31 @@
+"""Lifespan contexts for the MCP servers."""
+
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import AsyncIterator
+
+from src.common.utils import setup_logger
+
+logger = setup_logger(__name__)
+
+
+@dataclass
+class FileContext:
+    """Resources shared by the file MCP tools."""
+
+    base_path: Path
+
+
+@asynccontextmanager
+async def file_lifespan(server) -> AsyncIterator[FileContext]:
+    """Resolve and create the sandbox directory for file tools."""
+    import os
+
+    base_path = Path(os.getenv("FILE_MCP_ROOT", "workspace")).resolve()
+    base_path.mkdir(parents=True, exist_ok=True)
+    logger.info(f"File lifespan started with base path {base_path}")
+    try:
+        yield FileContext(base_path=base_path)
+    finally:
+        logger.info("File lifespan finished")
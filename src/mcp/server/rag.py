@@ -0,0 +1,84 @@
+"""RAG MCP server: document retrieval and ingestion tools."""
+
+import asyncio
+import os
+from typing import Any, Dict, List, Optional
+
+from mcp.server.fastmcp import Context, FastMCP
+
+from src.common.config import config
+from src.common.utils import setup_logger
+from src.rag.retriever.retriever import EmbeddingRetriever
+
+logger = setup_logger(__name__)
+
+rag_mcp = FastMCP("rag")
+
+# Bounds concurrent retriever work so a burst of tool calls cannot
+# pile up unbounded embedding requests and FAISS threads.
+_RAG_SEMAPHORE = asyncio.Semaphore(int(os.getenv("RAG_MAX_CONCURRENCY", "16")))
+
+_retriever: Optional[EmbeddingRetriever] = None
+
+
+def _get_retriever() -> EmbeddingRetriever:
+    """Return the process-wide retriever, creating it on first use.
+
+    A lazy module-level singleton rather than lifespan state: the
+    in-proc client dispatches tool calls outside any MCP request (so
+    there is no request context to read), and the streamable-HTTP
+    transport enters the FastMCP lifespan once per session, which would
+    hand every session its own empty vector store. Built on first call
+    so importing the server never pays for the embedding HTTP clients;
+    src.app closes it at process shutdown via close_retriever.
+    """
+    global _retriever
+    if _retriever is None:
+        _retriever = EmbeddingRetriever(config.rag.embedding_model)
+    return _retriever
+
+
+async def close_retriever() -> None:
+    """Close the retriever's HTTP clients (process shutdown only)."""
+    global _retriever
+    if _retriever is not None:
+        await _retriever.model.aclose()
+        _retriever = None
+
+
+@rag_mcp.tool()
+async def retrieve_documents(query: str, top_k: int = 5, ctx: Context = None) -> Dict[str, Any]:
+    """Retrieve the documents most relevant to a query."""
+    try:
+        async with _RAG_SEMAPHORE:
+            results = await _get_retriever().retrieve(query, top_k)
+        return {"success": True, "results": results}
+    except Exception as e:
+        logger.error(f"retrieve_documents failed: {e}")
+        return {"success": False, "error": str(e)}
+
+
+@rag_mcp.tool()
+async def embed_document(
+    text: str, metadata: Optional[Dict[str, Any]] = None, ctx: Context = None
+) -> Dict[str, Any]:
+    """Embed one document and add it to the vector store."""
+    try:
+        async with _RAG_SEMAPHORE:
+            doc_id = await _get_retriever().embed_document(text, metadata)
+        return {"success": True, "id": doc_id}
+    except Exception as e:
+        logger.error(f"embed_document failed: {e}")
+        return {"success": False, "error": str(e)}
+
+
+@rag_mcp.tool()
+async def embed_documents(texts: List[str], ctx: Context = None) -> Dict[str, Any]:
+    """Embed a batch of documents and add them to the vector store."""
+    try:
+        async with _RAG_SEMAPHORE:
+            ids = await _get_retriever().embed_documents(texts)
+        return {"success": True, "ids": ids}
+    except Exception as e:
+        logger.error(f"embed_documents failed: {e}")
+        return {"success": False, "error": str(e)}
@@ -0,0 +1,204 @@
+"""Embedding model clients for OpenAI-compatible embedding APIs."""
+
+import asyncio
+from typing import Any, Dict, List
+
+import httpx
+import numpy as np
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional streaming parser
+    ijson = None
+
+from src.common.config import config
+from src.common.utils import json_loads, setup_logger
+
+logger = setup_logger(__name__)
+
+
+class EmbeddingModel:
+    """Base class for embedding providers.
+
+    embed_batch splits large inputs into sub-batches dispatched
+    concurrently under a semaphore: one giant request would serialize
+    on a single long HTTP call (and can exceed provider input limits),
+    while unbounded fan-out would trip provider rate limits.
+    """
+
+    def __init__(self, model_name: str, sub_batch_size: int = 96, max_concurrency: int = 8):
+        self.model_name = model_name
+        self.sub_batch_size = sub_batch_size
+        self.max_concurrency = max_concurrency
+
+    def _make_client(self) -> httpx.AsyncClient:
+        """Build this model's persistent client.
+
+        base_url and the auth headers are bound once so httpx caches the
+        encoded header bytes and every call reuses the same keep-alive
+        pool; HTTP/2 multiplexing is enabled when h2 is installed.
+        """
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+        }
+        limits = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+        timeout = httpx.Timeout(60.0, connect=5.0)
+        try:
+            return httpx.AsyncClient(
+                base_url=self.base_url,
+                headers=headers,
+                http2=True,
+                limits=limits,
+                timeout=timeout,
+            )
+        except ImportError:
+            return httpx.AsyncClient(
+                base_url=self.base_url, headers=headers, limits=limits, timeout=timeout
+            )
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    async def embed_text(self, text: str) -> List[float]:
+        raise NotImplementedError
+
+    async def embed_text_np(self, text: str) -> np.ndarray:
+        """Embed one text straight into a float32 vector.
+
+        np.asarray over the parsed JSON array is the only copy; callers
+        hand the row to FAISS without a Python-list intermediate.
+        """
+        return np.asarray(await self.embed_text(text), dtype=np.float32)
+
+    async def _embed_once(self, texts: List[str]) -> List[List[float]]:
+        """One embeddings request for a single sub-batch."""
+        raise NotImplementedError
+
+    # Below this the whole-body parse beats incremental-parsing overhead.
+    _STREAM_MIN_TEXTS = 32
+
+    async def _request_embeddings(self, payload: Dict[str, Any], n: int):
+        """POST one embeddings request and parse the response.
+
+        Large batches are parsed incrementally with ijson when it is
+        installed: embedding rows stream straight into a preallocated
+        float32 matrix while the body downloads, instead of
+        materializing megabytes of JSON text plus a second
+        list-of-lists copy. Small batches take the plain orjson path.
+        """
+        if ijson is not None and n >= self._STREAM_MIN_TEXTS:
+            matrix = None
+            async with self._client.stream(
+                "POST", "/embeddings", json=payload
+            ) as response:
+                response.raise_for_status()
+                items = ijson.sendable_list()
+                parser = ijson.items_coro(items, "data.item", use_float=True)
+                async for chunk in response.aiter_bytes():
+                    try:
+                        parser.send(chunk)
+                    except StopIteration:
+                        pass
+                    for item in items:
+                        row = np.asarray(item["embedding"], dtype=np.float32)
+                        if matrix is None:
+                            matrix = np.empty((n, row.shape[0]), dtype=np.float32)
+                        matrix[item["index"]] = row
+                    del items[:]
+            if matrix is None:
+                raise RuntimeError("Embedding response contained no data items")
+            return matrix
+        response = await self._client.post("/embeddings", json=payload)
+        response.raise_for_status()
+        data = json_loads(response.content)
+        # Index-write into a right-sized list: O(N) with no comparator
+        # calls, versus sorting the response items by their "index".
+        out: List[List[float]] = [None] * n
+        for item in data["data"]:
+            out[item["index"]] = item["embedding"]
+        return out
+
+    async def embed_batch(self, texts: List[str]) -> List[List[float]]:
+        if len(texts) <= self.sub_batch_size:
+            return await self._embed_once(texts)
+        chunks = [
+            texts[i : i + self.sub_batch_size]
+            for i in range(0, len(texts), self.sub_batch_size)
+        ]
+        sem = asyncio.Semaphore(self.max_concurrency)
+
+        async def _one(chunk: List[str]) -> List[List[float]]:
+            async with sem:
+                return await self._embed_once(chunk)
+
+        parts = await asyncio.gather(*[_one(chunk) for chunk in chunks])
+        embeddings: List[List[float]] = []
+        for part in parts:
+            embeddings.extend(part)
+        return embeddings
+
+
+class OpenAIEmbeddingModel(EmbeddingModel):
+    """Embeddings via the OpenAI /embeddings endpoint."""
+
+    base_url = "https://api.openai.com/v1"
+
+    def __init__(self, model_name: str = "text-embedding-3-small"):
+        super().__init__(model_name)
+        self.api_key = config.llm.openai_api_key
+        self._client = self._make_client()
+
+    async def embed_text(self, text: str) -> List[float]:
+        response = await self._client.post(
+            "/embeddings", json={"model": self.model_name, "input": text}
+        )
+        response.raise_for_status()
+        data = json_loads(response.content)
+        return data["data"][0]["embedding"]
+
+    async def _embed_once(self, texts: List[str]) -> List[List[float]]:
+        return await self._request_embeddings(
+            {"model": self.model_name, "input": texts}, len(texts)
+        )
+
+
+class NVIDIAEmbeddingModel(EmbeddingModel):
+    """Embeddings via NVIDIA NIM (OpenAI-compatible) endpoints."""
+
+    base_url = "https://integrate.api.nvidia.com/v1"
+
+    def __init__(self, model_name: str = "baai/bge-m3"):
+        super().__init__(model_name)
+        self.api_key = config.llm.nvidia_api_key
+        self._client = self._make_client()
+
+    async def embed_text(self, text: str) -> List[float]:
+        response = await self._client.post(
+            "/embeddings",
+            json={
+                "model": self.model_name,
+                "input": [text],
+                "input_type": "query",
+            },
+        )
+        response.raise_for_status()
+        data = json_loads(response.content)
+        return data["data"][0]["embedding"]
+
+    async def _embed_once(self, texts: List[str]) -> List[List[float]]:
+        return await self._request_embeddings(
+            {
+                "model": self.model_name,
+                "input": texts,
+                "input_type": "passage",
+            },
+            len(texts),
+        )
+
+
+def get_embedding_model(model_name: str) -> EmbeddingModel:
+    """Pick the provider class from the model name."""
+    if model_name.startswith("text-embedding"):
+        return OpenAIEmbeddingModel(model_name)
+    return NVIDIAEmbeddingModel(model_name)
@@ -0,0 +1,34 @@
+"""Optional Numba-JIT scoring kernels for the brute-force search path.
+
+Numba is not a hard dependency: when it is missing ``topk_ip`` is None
+and callers fall back to FAISS.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # pragma: no cover - optional dependency
+    njit = None
+
+
+if njit is not None:
+
+    @njit(cache=True, parallel=True, fastmath=True)
+    def topk_ip(mat: np.ndarray, q: np.ndarray, k: int):
+        """Top-k inner products of ``q`` against the rows of ``mat``.
+
+        Returns (indices sorted by descending score, all scores).
+        """
+        n = mat.shape[0]
+        scores = np.empty(n, np.float32)
+        for i in prange(n):
+            s = np.float32(0.0)
+            for j in range(mat.shape[1]):
+                s += mat[i, j] * q[j]
+            scores[i] = s
+        idx = np.argpartition(-scores, k - 1)[:k]
+        return idx[np.argsort(-scores[idx])], scores
+
+else:
+    topk_ip = None
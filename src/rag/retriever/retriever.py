@@ -0,0 +1,103 @@
+"""High-level retriever tying the embedding model to the vector store."""
+
+import asyncio
+import os
+from hashlib import blake2b
+from typing import Any, Dict, List, Optional
+
+try:
+    import diskcache
+except ImportError:  # pragma: no cover - optional persistent cache
+    diskcache = None
+
+from src.common.config import config
+from src.common.utils import setup_logger
+from src.rag.embeddings.models import get_embedding_model
+from src.rag.retriever.vector_store import FAISSVectorStore
+
+logger = setup_logger(__name__)
+
+
+class EmbeddingRetriever:
+    """Embeds documents/queries and searches the FAISS store.
+
+    Embeddings are cached by content hash: re-ingesting a document that
+    was embedded before (near-duplicate corpora, repeated runs) skips
+    the network round-trip entirely. With diskcache installed the cache
+    survives process restarts; otherwise it is a per-process dict.
+    """
+
+    def __init__(self, model_name: Optional[str] = None, dim: Optional[int] = None):
+        self.model_name = model_name or config.rag.embedding_model
+        self.model = get_embedding_model(self.model_name)
+        self.vector_store = FAISSVectorStore(dim or config.rag.embedding_dim)
+        if diskcache is not None:
+            cache_dir = os.path.join(
+                os.path.dirname(config.rag.index_path) or ".", "embedding_cache"
+            )
+            self._embed_cache = diskcache.Cache(cache_dir)
+        else:
+            self._embed_cache: Dict[str, List[float]] = {}
+
+    def _cache_key(self, text: str) -> str:
+        # Model name in the key: the same text embeds differently per model.
+        return f"{self.model_name}:{blake2b(text.encode(), digest_size=16).hexdigest()}"
+
+    async def embed_document(
+        self, document: str, metadata: Optional[Dict[str, Any]] = None
+    ) -> int:
+        """Embed one document and add it to the store."""
+        key = self._cache_key(document)
+        embedding = self._embed_cache.get(key)
+        if embedding is None:
+            embedding = await self.model.embed_text_np(document)
+            self._embed_cache[key] = embedding
+        return self.vector_store.add_document(document, embedding, metadata)
+
+    async def embed_documents(
+        self, documents: List[str], metadatas: Optional[List[Dict[str, Any]]] = None
+    ) -> List[int]:
+        """Embed a batch of documents and add them to the store.
+
+        Only unique cache misses go through embed_batch — chunked
+        ingestion commonly repeats texts, and each distinct text should
+        be billed once — with results scattered back into the caller's
+        order.
+        """
+        keys = [self._cache_key(doc) for doc in documents]
+        embeddings: List[Any] = [self._embed_cache.get(key) for key in keys]
+        miss_positions = [i for i, emb in enumerate(embeddings) if emb is None]
+        if miss_positions:
+            seen = set()
+            unique_positions = []
+            for i in miss_positions:
+                if keys[i] not in seen:
+                    seen.add(keys[i])
+                    unique_positions.append(i)
+            missed = await self.model.embed_batch(
+                [documents[i] for i in unique_positions]
+            )
+            by_key = {keys[i]: emb for i, emb in zip(unique_positions, missed)}
+            for i in miss_positions:
+                embeddings[i] = by_key[keys[i]]
+                self._embed_cache[keys[i]] = embeddings[i]
+        # FAISS inserts are CPU work (and release the GIL); keep them
+        # off the event loop so concurrent tool calls make progress.
+        return await asyncio.to_thread(
+            self.vector_store.add_documents, documents, embeddings, metadatas
+        )
+
+    async def retrieve(self, query: str, top_k: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Return the documents most relevant to ``query``."""
+        query_embedding = await self.model.embed_text_np(query)
+        results = await asyncio.to_thread(
+            self.vector_store.search, query_embedding, top_k or config.rag.top_k
+        )
+        logger.debug("Retrieved %d documents for query: %s", len(results), query)
+        return results
+
+    def save(self, path: Optional[str] = None) -> None:
+        self.vector_store.save(path or config.rag.index_path)
+
+    def load(self, path: Optional[str] = None) -> None:
+        self.vector_store.load(path or config.rag.index_path)
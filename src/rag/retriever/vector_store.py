@@ -0,0 +1,342 @@
+"""FAISS-backed vector store with columnar document metadata."""
+
+import json
+import os
+import threading
+from typing import Any, Dict, List, Optional
+
+import faiss
+import numpy as np
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+except ImportError:  # pragma: no cover - optional fast persistence
+    pa = None
+    feather = None
+
+from src.common.utils import json_dumps, json_loads, setup_logger
+from src.rag.retriever._kernels import topk_ip
+
+logger = setup_logger(__name__)
+
+
+class FAISSVectorStore:
+    """Stores embeddings in a FAISS index and documents alongside.
+
+    Documents live as parallel arrays (texts, metadatas) indexed by the
+    FAISS row id rather than a list of wrapping dicts: results need no
+    per-hit dict lookups and persistence writes columns instead of
+    serializing a Python object graph. Document ids ARE the row
+    positions — there is no separate id column to keep in sync, and a
+    search hit resolves to its text and metadata by direct indexing.
+
+    ``index_type`` picks the search structure: "hnsw" (default) walks a
+    graph instead of scanning every vector, "ivfpq" adds inverted lists
+    with product-quantized codes for large corpora (training is
+    deferred until enough vectors have accumulated; until then searches
+    scan the buffer exactly), and "flat" keeps the exact brute-force
+    scan.
+
+    ``index_precision`` = "int8" stores vectors as 8-bit scalar-quantized
+    codes instead of float32: a quarter of the memory traffic per scan
+    at the cost of a small recall loss (the quantizer is trained on the
+    first added batch, so that batch should be representative).
+
+    ``backend`` = "numba" keeps the raw normalized matrix and scores
+    queries with a JIT-compiled brute-force kernel instead of FAISS —
+    exact results, useful for debugging and benchmarking against the
+    approximate indexes. Requires numba; falls back to FAISS otherwise.
+    """
+
+    def __init__(
+        self,
+        dim: int,
+        index_type: str = "hnsw",
+        index_precision: str = "float32",
+        backend: str = "faiss",
+    ):
+        self.dim = dim
+        self.index_type = index_type
+        self.index_precision = index_precision
+        if backend == "numba" and topk_ip is None:
+            logger.warning("numba backend requested but numba is not installed; using FAISS")
+            backend = "faiss"
+        self.backend = backend
+        self.index = self._make_index()
+        # Rows below this are in the FAISS index; rows above it sit in
+        # the buffer awaiting training (IVF only, see _train_min).
+        self._indexed = 0
+        self.texts: List[str] = []
+        self.metas: List[Dict[str, Any]] = []
+        # Growable backing buffer of normalized vectors: amortized O(1)
+        # inserts with no per-document temporaries, the raw matrix for
+        # the numba kernel, and the payload persisted by save().
+        self._capacity = 1024
+        self._buf = np.empty((self._capacity, dim), dtype=np.float32)
+        self._n = 0
+        # Callers run adds and searches in worker threads
+        # (asyncio.to_thread); this guards _buf/_n/texts/metas and the
+        # FAISS index, none of which tolerate concurrent mutation.
+        self._lock = threading.Lock()
+
+    def _ensure_capacity(self, needed: int) -> None:
+        if needed <= self._capacity and self._buf.flags.writeable:
+            return
+        capacity = max(self._capacity, 1024)
+        while capacity < needed:
+            capacity *= 2
+        # Also materializes a writable copy when _buf is a read-only
+        # memory map from load().
+        buf = np.empty((capacity, self.dim), dtype=np.float32)
+        buf[: self._n] = self._buf[: self._n]
+        self._buf = buf
+        self._capacity = capacity
+
+    def _make_index(self):
+        # Inner product over unit-norm vectors == cosine similarity, the
+        # intended metric for BGE-style embeddings; vectors are
+        # normalized at insert and query time.
+        if self.index_precision == "int8":
+            return faiss.IndexScalarQuantizer(
+                self.dim, faiss.ScalarQuantizer.QT_8bit, faiss.METRIC_INNER_PRODUCT
+            )
+        if self.index_precision != "float32":
+            raise ValueError(f"Unknown index precision: {self.index_precision}")
+        if self.index_type == "hnsw":
+            index = faiss.IndexHNSWFlat(self.dim, 32, faiss.METRIC_INNER_PRODUCT)
+            index.hnsw.efConstruction = 200
+            index.hnsw.efSearch = 64
+            return index
+        if self.index_type == "ivfpq":
+            quantizer = faiss.IndexFlatIP(self.dim)
+            return faiss.IndexIVFPQ(
+                quantizer, self.dim, 256, 8, 8, faiss.METRIC_INNER_PRODUCT
+            )
+        if self.index_type == "flat":
+            return faiss.IndexFlatIP(self.dim)
+        raise ValueError(f"Unknown index type: {self.index_type}")
+
+    # k-means wants well over nlist training points (faiss's guideline
+    # is ~39 per centroid, and below nlist it hard-errors).
+    _IVF_TRAIN_MIN = 256 * 39
+
+    def _train_min(self) -> int:
+        """Vectors required before the index is trained."""
+        if self.index_type == "ivfpq" and self.index_precision == "float32":
+            return self._IVF_TRAIN_MIN
+        # Scalar quantizers train on any batch; flat and HNSW report
+        # trained from the start.
+        return 1
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def add_document(
+        self, text: str, embedding: List[float], metadata: Optional[Dict[str, Any]] = None
+    ) -> int:
+        """Add one document; returns its id."""
+        return self.add_documents([text], [embedding], [metadata or {}])[0]
+
+    def add_documents(
+        self,
+        texts: List[str],
+        embeddings: List[List[float]],
+        metadatas: Optional[List[Dict[str, Any]]] = None,
+    ) -> List[int]:
+        """Add a batch of documents; returns their ids."""
+        if len(texts) != len(embeddings):
+            raise ValueError("texts and embeddings must have the same length")
+        if metadatas is not None and len(metadatas) != len(texts):
+            raise ValueError("metadatas must match texts in length")
+        # One contiguous (N, dim) matrix and one index.add: a single
+        # Python/C crossing instead of a per-row array build and insert.
+        matrix = np.ascontiguousarray(np.asarray(embeddings, dtype=np.float32))
+        if matrix.shape != (len(texts), self.dim):
+            raise ValueError(
+                f"Expected embeddings of shape ({len(texts)}, {self.dim}), got {matrix.shape}"
+            )
+        faiss.normalize_L2(matrix)
+        with self._lock:
+            start = len(self.texts)
+            self._ensure_capacity(self._n + len(texts))
+            self._buf[self._n : self._n + len(texts)] = matrix
+            self._n += len(texts)
+            if self.backend != "numba":
+                if not self.index.is_trained and self._n >= self._train_min():
+                    # Train on everything buffered so far, not just this
+                    # batch, so the centroids see the whole corpus.
+                    self.index.train(self._buf[: self._n])
+                if self.index.is_trained:
+                    pending = self._buf[self._indexed : self._n]
+                    if pending.shape[0]:
+                        self.index.add(pending)
+                    self._indexed = self._n
+            self.texts.extend(texts)
+            if metadatas is not None:
+                self.metas.extend(metadatas)
+            else:
+                self.metas.extend({} for _ in texts)
+            return list(range(start, start + len(texts)))
+
+    def search(self, query_embedding: List[float], top_k: int = 5) -> List[Dict[str, Any]]:
+        """Return the top_k most similar documents with scores."""
+        if not self.texts:
+            return []
+        query = np.array([query_embedding], dtype=np.float32)
+        faiss.normalize_L2(query)
+        with self._lock:
+            k = min(top_k, len(self.texts))
+            if self.backend == "numba":
+                top_idx, all_scores = topk_ip(self._buf[: self._n], query[0], k)
+                indices = top_idx.reshape(1, -1)
+                scores = all_scores[top_idx].reshape(1, -1)
+            elif not self.index.is_trained or self._indexed < self._n:
+                # Training still deferred: exact scan of the buffer,
+                # cheap at the sizes that fit under _train_min.
+                all_scores = self._buf[: self._n] @ query[0]
+                top = np.argpartition(-all_scores, k - 1)[:k]
+                top = top[np.argsort(-all_scores[top])]
+                indices = top.reshape(1, -1)
+                scores = all_scores[top].reshape(1, -1)
+            else:
+                scores, indices = self.index.search(query, k)
+            results = []
+            for i, idx in enumerate(indices[0]):
+                if idx < 0:
+                    continue
+                results.append(
+                    {
+                        "id": int(idx),
+                        "text": self.texts[idx],
+                        "metadata": self.metas[idx],
+                        # Inner product of unit vectors is already the
+                        # cosine similarity; no distance conversion needed.
+                        "score": float(scores[0][i]),
+                    }
+                )
+        return results
+
+    def save(self, path: str) -> None:
+        """Persist the index and documents under ``path``."""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with self._lock:
+            self._save_locked(path)
+        logger.info(f"Saved vector store with {len(self.texts)} documents to {path}")
+
+    def _save_locked(self, path: str) -> None:
+        faiss.write_index(self.index, f"{path}.faiss")
+        # Record how the index was built so load() restores matching
+        # attributes (read_index alone recovers the class, not these).
+        with open(f"{path}.config.json", "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "dim": self.dim,
+                    "index_type": self.index_type,
+                    "index_precision": self.index_precision,
+                },
+                f,
+            )
+        if feather is not None:
+            # Columnar write: O(bytes), no per-document Python objects.
+            table = pa.table(
+                {
+                    "text": self.texts,
+                    "meta": [json_dumps(m) for m in self.metas],
+                }
+            )
+            feather.write_feather(table, f"{path}.feather")
+        else:
+            # One record per line: serialization streams row by row
+            # instead of materializing one monolithic JSON blob at
+            # roughly twice the store's resident size.
+            with open(f"{path}.jsonl", "wb") as f:
+                for text, meta in zip(self.texts, self.metas):
+                    f.write(json_dumps({"text": text, "meta": meta}))
+                    f.write(b"\n")
+        np.save(f"{path}.npy", self._buf[: self._n])
+
+    def load(self, path: str) -> None:
+        """Load a previously saved index and documents."""
+        with self._lock:
+            self._load_locked(path)
+        logger.info(f"Loaded vector store with {len(self.texts)} documents from {path}")
+
+    def _load_locked(self, path: str) -> None:
+        # The config sidecar is read first so the index type is known
+        # before the index file is opened.
+        config_path = f"{path}.config.json"
+        if os.path.exists(config_path):
+            with open(config_path, encoding="utf-8") as f:
+                saved = json.load(f)
+            self.dim = saved.get("dim", self.dim)
+            self.index_type = saved.get("index_type", self.index_type)
+            self.index_precision = saved.get("index_precision", self.index_precision)
+        if self.index_type == "ivfpq":
+            # A mmap'd read-only load gives the index OnDiskInvertedLists,
+            # which reject every subsequent add; this store accepts
+            # inserts after load, so ivfpq pays the full read instead.
+            self.index = faiss.read_index(f"{path}.faiss")
+        else:
+            # Memory-mapped read-only open: cold start faults in only the
+            # index pages a search actually touches instead of paying a
+            # full sequential read of the file up front.
+            self.index = faiss.read_index(
+                f"{path}.faiss", faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY
+            )
+        # ntotal, not _n: a store saved before its IVF index trained
+        # still has its rows pending.
+        self._indexed = int(self.index.ntotal)
+        feather_path = f"{path}.feather"
+        jsonl_path = f"{path}.jsonl"
+        if feather is not None and os.path.exists(feather_path):
+            table = feather.read_table(feather_path)
+            self.texts = table.column("text").to_pylist()
+            self.metas = [json_loads(m) for m in table.column("meta").to_pylist()]
+        elif os.path.exists(jsonl_path):
+            self.texts = []
+            self.metas = []
+            with open(jsonl_path, "rb") as f:
+                for line in f:
+                    record = json_loads(line)
+                    self.texts.append(record["text"])
+                    self.metas.append(record["meta"])
+        else:
+            # Legacy single-blob layouts from earlier saves.
+            with open(f"{path}.json", encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                self.texts = data["texts"]
+                self.metas = data["metas"]
+            else:
+                self.texts = [doc["text"] for doc in data]
+                self.metas = [doc.get("metadata", {}) for doc in data]
+        vectors_path = f"{path}.npy"
+        if os.path.exists(vectors_path):
+            # Memory-mapped: cold start does not pay a full read, and
+            # _ensure_capacity copies to a writable buffer on first add.
+            self._buf = np.load(vectors_path, mmap_mode="r")
+            self._n = self._buf.shape[0]
+            self._capacity = self._n
+        elif self.backend == "numba":
+            raise RuntimeError(f"numba backend needs the raw vectors; {vectors_path} is missing")
+        else:
+            # Pre-sidecar saves have no raw-vector file. Rebuild the
+            # buffer from the index so _n == len(texts) holds — leaving
+            # _n at 0 would make the next add_documents overwrite row 0
+            # and desync document ids from buffer rows. Reconstruction
+            # is lossy for quantized indexes but keeps alignment.
+            n = int(self.index.ntotal)
+            if n < len(self.texts):
+                raise RuntimeError(
+                    f"{vectors_path} is missing and the index holds only "
+                    f"{n} of {len(self.texts)} vectors"
+                )
+            self._capacity = max(n, 1024)
+            self._buf = np.empty((self._capacity, self.dim), dtype=np.float32)
+            if n:
+                if self.index_type == "ivfpq":
+                    # IVF reconstruction needs the id -> list direct map.
+                    self.index.make_direct_map()
+                self.index.reconstruct_n(0, n, self._buf[:n])
+            self._n = n